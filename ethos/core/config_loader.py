@@ -13,6 +13,11 @@ import yaml
 
 from ethos.core.exceptions import ConfigError
 
+try:
+    from yaml import CSafeLoader as _YamlLoader    # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 def load_config(source: Union[str, Dict[str, Any], None]) -> Dict[str, Any]:
     """
@@ -58,7 +63,7 @@ def load_config(source: Union[str, Dict[str, Any], None]) -> Dict[str, Any]:
             )
         try:
             with open(source, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
             return data if data is not None else {}
         except yaml.YAMLError as exc:
             raise ConfigError(
@@ -90,7 +95,7 @@ def _resolve_preset(name: str) -> Dict[str, Any] | None:
 
     try:
         with open(preset_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         return data if data is not None else {}
     except yaml.YAMLError as exc:
         raise ConfigError(
@@ -10,6 +10,7 @@ PUBLIC API:
   ProtectResult        — returned by protect()
   BaseDetector         — base class for custom detector plugins
   BaseVaultBackend     — base class for custom storage backends
+  VaultEntry           — encrypted record passed to/from vault backends
   VaultAccessError     — raised on any vault access denial
   ConfidentialDataError— raised on security policy violations
 
@@ -21,7 +22,7 @@ from ethos.privacy.privacy_data_security import PrivacyDataSecurity
 from ethos.privacy.config.privacy_config import PrivacyConfig
 from ethos.core.data_types import ProtectResult
 from ethos.core.exceptions import VaultAccessError, ConfidentialDataError
-from ethos.privacy._core.vault.backends.base_backend import BaseVaultBackend
+from ethos.privacy._core.vault.backends.base_backend import BaseVaultBackend, VaultEntry
 
 
 # ── Stub for BaseDetector (extension point) ───────────────────────────────────
@@ -76,6 +77,7 @@ __all__ = [
     "ProtectResult",
     "BaseDetector",
     "BaseVaultBackend",
+    "VaultEntry",
     "VaultAccessError",
     "ConfidentialDataError",
 ]
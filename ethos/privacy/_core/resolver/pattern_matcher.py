@@ -7,15 +7,16 @@ Finds all ⟨TKN_*⟩ tokens in any text string.
 
 from __future__ import annotations
 
+import re
 from typing import List, Tuple
 
-import regex
-
 
 # ── Token scan pattern ────────────────────────────────────────────────────────
 # Must match EXACTLY the format produced by token_engine.generate_token()
 # ⟨TKN_{TYPE}_{8-UPPERCASE-HEX}⟩
-TOKEN_SCAN_RE = regex.compile(
+# Stdlib re: the pattern needs no `regex` features, and re's literal-prefix
+# search skips straight to each "⟨TKN_" in long AI responses.
+TOKEN_SCAN_RE = re.compile(
     r"⟨TKN_([A-Z][A-Z0-9_]*)_([A-F0-9]{8})⟩"
 )
 
@@ -45,15 +46,9 @@ def find_tokens(text: str) -> List[Tuple[str, int, int]]:
 
 def count_tokens(text: str) -> int:
     """Return the number of tokens found in text."""
-    return len(find_tokens(text))
+    return sum(1 for _ in TOKEN_SCAN_RE.finditer(text))
 
 
 def extract_unique_tokens(text: str) -> List[str]:
     """Return a list of unique token strings found in text (preserving order)."""
-    seen   = set()
-    result = []
-    for token_str, _, _ in find_tokens(text):
-        if token_str not in seen:
-            seen.add(token_str)
-            result.append(token_str)
-    return result
+    return list(dict.fromkeys(m.group(0) for m in TOKEN_SCAN_RE.finditer(text)))
@@ -87,24 +87,24 @@ class TokenResolver:
         if not token_matches:
             return text
 
-        # Work backwards to preserve positions
-        result = text
-        processed = set()
-
-        for token_str, start, end in reversed(token_matches):
-            if token_str in processed:
+        # Look each distinct token up once, last occurrence first
+        resolved: Dict[str, str] = {}
+        for token_str, _, _ in reversed(token_matches):
+            if token_str in resolved:
                 continue
-            processed.add(token_str)
-
             real_value = self._lookup(token_str, session_id)
-            if real_value is None:
-                # Leave token in place
-                continue
-
-            # Replace ALL occurrences of this token in the text
-            result = result.replace(token_str, real_value)
-
-        return result
+            # None → leave token in place
+            resolved[token_str] = token_str if real_value is None else real_value
+
+        # Rebuild the text in one pass from the match positions
+        parts: List[str] = []
+        pos = 0
+        for token_str, start, end in token_matches:
+            parts.append(text[pos:start])
+            parts.append(resolved[token_str])
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts)
 
     # ── Dict resolution ───────────────────────────────────────────────────────
 
@@ -31,8 +31,11 @@ FALLBACK:
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
+
 import regex
-from typing import Any, Dict, List, Optional
 
 from ethos.core.data_types import AlertLevel, DataFamily, ScanResult
 
@@ -146,7 +149,7 @@ class NLPEngine:
         if not self._available or not text or not text.strip():
             return []
 
-        existing = existing_spans or []
+        existing = _span_index(existing_spans or [])
         results: List[ScanResult] = []
 
         doc = self._nlp(text)
@@ -212,12 +215,27 @@ class NLPEngine:
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _overlaps(start: int, end: int, spans: List[tuple]) -> bool:
-    """Return True if (start, end) overlaps any span in spans."""
-    for s, e in spans:
-        if not (end <= s or start >= e):
-            return True
-    return False
+def _span_index(spans: List[tuple]) -> Tuple[List[int], List[int]]:
+    """
+    Build a lookup structure for _overlaps(): span starts in ascending
+    order, paired with the running maximum of their end offsets.
+    """
+    ordered  = sorted(spans)
+    starts   = [s for s, _ in ordered]
+    max_ends = list(accumulate((e for _, e in ordered), max))
+    return starts, max_ends
+
+
+def _overlaps(start: int, end: int, index: Tuple[List[int], List[int]]) -> bool:
+    """
+    Return True if (start, end) overlaps any span in the index.
+
+    Only spans that begin before `end` can overlap; of those, it is enough
+    that the furthest-reaching one ends after `start`. O(log n) per query.
+    """
+    starts, max_ends = index
+    i = bisect_left(starts, end)
+    return i > 0 and max_ends[i - 1] > start
 
 
 def _warn(msg: str) -> None:
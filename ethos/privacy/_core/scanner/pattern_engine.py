@@ -75,6 +75,20 @@ class PatternEngine:
         self.enabled_families  = enabled_families
         self._threshold        = _SENSITIVITY_THRESHOLD.get(sensitivity, 0.70)
 
+        # Family and confidence filters depend only on the config, so they are
+        # applied once here: scan() walks just the patterns that can report.
+        # Each entry: (type, compiled pattern, confidence, alert level,
+        # validator or None, family).
+        self._active = [
+            (type_name, pattern, base_conf, alert_level,
+             _VALIDATORS.get(type_name) if has_validator else None,
+             _TYPE_TO_FAMILY.get(type_name, ""))
+            for type_name, pattern, base_conf, alert_level, has_validator in ALL_PATTERNS
+            if (not enabled_families
+                or _TYPE_TO_FAMILY.get(type_name, "") in enabled_families)
+            and base_conf >= self._threshold
+        ]
+
     def scan(self, text: str) -> List[ScanResult]:
         """
         Scan text and return all pattern matches.
@@ -91,18 +105,9 @@ class PatternEngine:
             deduplicated and sorted by position.
         """
         results: List[ScanResult] = []
+        threshold = self._threshold
 
-        for type_name, pattern, base_conf, alert_level, has_validator in ALL_PATTERNS:
-            # Family filter
-            if self.enabled_families:
-                family = _TYPE_TO_FAMILY.get(type_name, "")
-                if family not in self.enabled_families:
-                    continue
-
-            # Confidence below threshold → skip
-            if base_conf < self._threshold:
-                continue
-
+        for type_name, pattern, base_conf, alert_level, validator, family in self._active:
             try:
                 for match in pattern.finditer(text):
                     # Use group 1 if defined (the captured value), else full match
@@ -114,19 +119,17 @@ class PatternEngine:
 
                     # Extra validation for known types (Aadhaar, credit card)
                     conf = base_conf
-                    if has_validator and type_name in _VALIDATORS:
-                        passed = _VALIDATORS[type_name](value)
-                        if passed:
+                    if validator is not None:
+                        if validator(value):
                             conf = min(1.0, base_conf + 0.15)
                         else:
                             # Validation failed → lower confidence significantly
                             conf = base_conf * 0.3
-                            if conf < self._threshold:
+                            if conf < threshold:
                                 continue
 
                     start, end = match.span(1) if match.lastindex else match.span()
                     snippet    = _context_snippet(text, start, end)
-                    family     = _TYPE_TO_FAMILY.get(type_name, "")
 
                     results.append(ScanResult(
                         value          = value,
@@ -9,13 +9,19 @@ delegates to pattern and entropy engines to classify the value.
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
 import regex
 
 from ethos.core.data_types import AlertLevel, DataFamily, ScanResult
 
+# orjson is optional — a Rust JSON parser that is a drop-in for json.loads.
+# Both raise a ValueError subclass on malformed input.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 # ── .env line format: KEY=value with no quotes needed ─────────────────────────
 _ENV_LINE_RE = regex.compile(
@@ -116,9 +122,9 @@ class StructureEngine:
         for block_match in _JSON_BLOCK_RE.finditer(text):
             block = block_match.group(0)
             try:
-                data = json.loads(block)
+                data = _json_loads(block)
                 pairs = _flatten(data)
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:
                 # Not valid JSON — fall through without error
                 continue
 
@@ -172,8 +178,13 @@ def _make_result(
     end: int,
     strategy: str,
 ) -> ScanResult:
-    """Build a ScanResult for a structured key=value finding."""
-    snippet = text[max(0, start - 40): min(len(text), end + 40)]
+    """
+    Build a ScanResult for a structured key=value finding.
+
+    context_snippet is left unset: most structure hits are dropped by the
+    scanner's deduplication, so the snippet is filled in afterwards for
+    the survivors only (see universal_scanner._fill_snippets).
+    """
     return ScanResult(
         value          = value,
         type           = "STRUCTURED_SECRET",
@@ -183,7 +194,6 @@ def _make_result(
         alert_level    = AlertLevel.CRITICAL,
         strategy       = strategy,
         field_name     = key,
-        context_snippet= snippet.replace("\n", " "),
     )
 
 
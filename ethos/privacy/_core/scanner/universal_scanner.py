@@ -136,7 +136,9 @@ class UniversalScanner:
         )
         all_results.extend(nlp_results)
 
-        return _deduplicate(all_results)
+        kept = _deduplicate(all_results)
+        _fill_snippets(kept, text)
+        return kept
 
     # ── Dict scanning ─────────────────────────────────────────────────────────
 
@@ -168,6 +170,27 @@ class UniversalScanner:
         return _deduplicate(all_results)
 
 
+# ── Context snippets ──────────────────────────────────────────────────────────
+
+_SNIPPET_WINDOW = 40
+_SNIPPET_TABLE  = str.maketrans({"\n": " "})
+
+
+def _fill_snippets(results: List[ScanResult], text: str) -> None:
+    """
+    Fill in context_snippet (±40 chars) for results that were created
+    without one. Runs after deduplication so discarded hits never pay
+    for the slice.
+    """
+    for r in results:
+        if r.context_snippet is not None or r.position is None:
+            continue
+        start, end = r.position
+        r.context_snippet = text[
+            max(0, start - _SNIPPET_WINDOW): end + _SNIPPET_WINDOW
+        ].translate(_SNIPPET_TABLE)
+
+
 # ── Deduplication ─────────────────────────────────────────────────────────────
 
 def _deduplicate(results: List[ScanResult]) -> List[ScanResult]:
@@ -4,7 +4,8 @@ ethos.privacy._core.vault.alert_engine
 Step 11: Alert engine.
 Fires an alert whenever a CRITICAL-level type is vaulted.
 Alerts are emitted:
-  - Written to the audit log
+  - Written to the audit log (as alert fields on the store record;
+    the vault's alert list is a view over those records)
   - Delivered to any registered on_alert callback
   - Rotation recommendation appended for API keys / DB urls
 
@@ -13,10 +14,10 @@ CRITICAL families: SECRETS, FINANCIAL
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ethos.core.data_types import AlertLevel, DataFamily
+from ethos.privacy._core.vault.audit_log import AuditRow
 
 
 # ── Types that trigger rotation recommendations ───────────────────────────────
@@ -39,7 +40,9 @@ class AlertEngine:
     Usage
     -----
     alerts = AlertEngine(on_alert=my_callback)
-    alert  = alerts.check(scan_result, token)
+    if alerts.is_alert(family, alert_level):
+        row = audit_log.record(..., alert_level=alert_level, alert_fired=True)
+        alerts.notify(row, audit_log.mask_on_export)
 
     Callback signature: callback(alert_dict: dict) -> None
     """
@@ -55,65 +58,68 @@ class AlertEngine:
         self.enabled            = enabled
         self._critical_families = set(critical_families or _CRITICAL_FAMILIES)
         self._recommend_rotation = recommend_rotation
-        self._fired_alerts: List[Dict[str, Any]] = []
 
-    def check(
-        self,
-        data_type: str,
-        family: str,
-        alert_level: str,
-        token: str,
-        session_id: str,
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Evaluate whether an alert should fire for the given item.
-        If alert_level is CRITICAL or family is in critical_families → fires.
-
-        Parameters
-        ----------
-        data_type   : Type label (e.g. "OPENAI_KEY").
-        family      : Data family (e.g. "SECRETS").
-        alert_level : The alert level from the ScanResult.
-        token       : The token assigned in the vault.
-        session_id  : The owning session.
-
-        Returns
-        -------
-        dict or None
-            The alert dict if fired, None otherwise.
-        """
-        if not self.enabled:
-            return None
+        # Pre-built (message, recommendation) strings per data_type.
+        # Rotation types are known up front; anything else is built once
+        # on first sight and reused for every later alert of that type.
+        self._templates: Dict[str, Tuple[str, Optional[str]]] = {
+            t: self._build_template(t) for t in _ROTATION_TYPES
+        }
 
-        is_critical = (
+    def is_alert(self, family: str, alert_level: str) -> bool:
+        """True if vaulting an item of this family / level must raise an alert."""
+        return self.enabled and (
             alert_level == AlertLevel.CRITICAL
             or family in self._critical_families
         )
-        if not is_critical:
-            return None
+
+    def notify(self, row: AuditRow, mask: bool) -> None:
+        """
+        Deliver the alert for an alert-flagged audit row to the on_alert
+        callback, if one is registered. Built from the row exactly as
+        get_alerts() rebuilds it, so both report the same timestamp.
+        mask is the audit log's mask_on_export setting.
+        """
+        if self._on_alert is not None:
+            self._deliver(self.from_audit_entry(row.to_dict(mask)))
+
+    def build_alert(
+        self,
+        data_type:  str,
+        family:     str,
+        token:      str,
+        session_id: str,
+        timestamp:  str,
+    ) -> Dict[str, Any]:
+        """Build the alert dict from already-masked token / session values."""
+        template = self._templates.get(data_type)
+        if template is None:
+            template = self._templates[data_type] = self._build_template(data_type)
+        message, recommendation = template
 
         alert: Dict[str, Any] = {
-            "timestamp":   datetime.utcnow().isoformat() + "Z",
+            "timestamp":   timestamp,
             "type":        "SECURITY_ALERT",
             "severity":    "CRITICAL",
             "data_type":   data_type,
             "family":      family,
-            "token":       token[:16] + "...",
-            "session_id":  session_id[:12] + "...",
-            "message":     (
-                f"⚠ CRITICAL: {data_type} intercepted and vaulted. "
-                f"This type should never appear in plaintext messages."
-            ),
+            "token":       token,
+            "session_id":  session_id,
+            "message":     message,
         }
 
-        if self._recommend_rotation and data_type in _ROTATION_TYPES:
-            alert["recommendation"] = (
-                f"Rotate your {data_type.replace('_', ' ').title()} immediately. "
-                f"Its presence in a chat message is a potential data exposure incident."
-            )
+        if recommendation is not None:
+            alert["recommendation"] = recommendation
+        return alert
 
-        self._fired_alerts.append(alert)
+    def from_audit_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the alert dict for an alert-flagged audit log entry."""
+        return self.build_alert(
+            entry.get("data_type", ""), entry.get("family", ""),
+            entry["token"], entry["session_id"], entry["timestamp"],
+        )
 
+    def _deliver(self, alert: Dict[str, Any]) -> None:
         if self._on_alert:
             try:
                 self._on_alert(alert)
@@ -121,11 +127,16 @@ class AlertEngine:
                 # Never let a bad callback crash the vault
                 pass
 
-        return alert
-
-    def get_alerts(self) -> List[Dict[str, Any]]:
-        """Return all alerts that have fired in this session."""
-        return list(self._fired_alerts)
-
-    def clear(self) -> None:
-        self._fired_alerts.clear()
+    def _build_template(self, data_type: str) -> Tuple[str, Optional[str]]:
+        """Return the (message, recommendation) pair for a data_type."""
+        message = (
+            f"⚠ CRITICAL: {data_type} intercepted and vaulted. "
+            f"This type should never appear in plaintext messages."
+        )
+        recommendation = None
+        if self._recommend_rotation and data_type in _ROTATION_TYPES:
+            recommendation = (
+                f"Rotate your {data_type.replace('_', ' ').title()} immediately. "
+                f"Its presence in a chat message is a potential data exposure incident."
+            )
+        return message, recommendation
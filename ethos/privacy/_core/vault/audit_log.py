@@ -2,21 +2,165 @@
 ethos.privacy._core.vault.audit_log
 ====================================
 Step 10: Append-only audit log for all vault operations.
+Retention in memory is bounded; an optional sink receives every entry.
 
 Every store, retrieve, revoke, and purge is recorded with:
   timestamp, operation, token, session_id, caller, result
+
+Entries form a hash chain: each row stores the previous row's hash and
+hash = H(prev_hash + canonical_json(row)), with H = BLAKE3 when the
+blake3 package is installed, else BLAKE2b-256. Tampering with, removing
+or reordering a row breaks every hash after it (see verify_chain()).
 """
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import atexit
+import hashlib
+import heapq
+import json
+import math
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from ethos.privacy._core.vault.rwlock import RWLock
+
+try:
+    from blake3 import blake3 as _blake3
+
+    def _chain_hash(data: bytes) -> bytes:
+        return _blake3(data).digest()
+except ImportError:
+    def _chain_hash(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=32).digest()
+
+
+_GENESIS_HASH = b"\x00" * 32
+
+
+class AuditRow(NamedTuple):
+    """
+    One stored audit record: a plain tuple in fixed field order, so
+    record() allocates no dict in the common case. User-facing dicts are
+    built only when rows are read back through AuditLog.get_entries().
+
+    Attributes:
+        timestamp  : POSIX seconds.
+        operation  : "store" | "retrieve" | "revoke" | "purge" | "alert"
+        token      : Token (masked unless the log masks on export).
+        session_id : Session ID (masked unless the log masks on export).
+        caller     : Caller identity.
+        result     : "success" | "denied" | "expired" | "not_found" | …
+        extra      : None, or (key, value) pairs (data_type, family, count, …).
+        prev_hash  : Chain hash of the preceding row (32 bytes).
+        hash       : Chain hash of this row (32 bytes).
+    """
+    timestamp:  float
+    operation:  str
+    token:      str
+    session_id: str
+    caller:     str
+    result:     str
+    extra:      Optional[Tuple[Tuple[str, Any], ...]]
+    prev_hash:  bytes
+    hash:       bytes
+
+    def canonical(self) -> bytes:
+        """Deterministic serialisation hashed into the chain (hashes excluded)."""
+        return _canonical(self[:7])
+
+    def to_dict(self, mask: bool = False) -> Dict[str, Any]:
+        """
+        Return the public dict form, with an ISO-8601 UTC timestamp.
+        mask=True masks token / session_id (for rows stored unmasked).
+        """
+        out: Dict[str, Any] = {
+            "timestamp":  _format_ts(self.timestamp),
+            "operation":  self.operation,
+            "token":      mask_token(self.token) if mask else self.token,
+            "session_id": mask_session(self.session_id) if mask else self.session_id,
+            "caller":     self.caller,
+            "result":     self.result,
+        }
+        if self.extra:
+            out.update(self.extra)
+        out["prev_hash"] = self.prev_hash.hex()
+        out["hash"]      = self.hash.hex()
+        return out
+
+
+# enqueue() flushes once this many entries are waiting
+_FLUSH_BATCH = 64
+
+# Logs that may hold queued entries; flushed at interpreter exit so rows
+# below _FLUSH_BATCH still reach the sink when nobody calls close().
+_open_logs: "weakref.WeakSet[AuditLog]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_logs() -> None:
+    for log in list(_open_logs):
+        log.close()
+
+
+def _row_fields(
+    ts: float, operation: str, token: str, session_id: str, caller: str,
+    result: str, token_masked: Optional[str], session_masked: Optional[str],
+    extra: Dict[str, Any], mask_now: bool,
+) -> Tuple[Any, ...]:
+    """
+    Build the first seven AuditRow fields. With mask_now, token / session
+    are stored masked (pre-masked forms preferred); otherwise raw values
+    are stored and masked on export.
+    """
+    if mask_now:
+        token      = token_masked if token_masked is not None else mask_token(token)
+        session_id = session_masked if session_masked is not None else mask_session(session_id)
+    else:
+        token      = token or token_masked or ""
+        session_id = session_id or session_masked or ""
+    return (
+        ts,
+        operation,
+        token,
+        session_id,
+        caller,
+        result,
+        tuple(extra.items()) if extra else None,
+    )
+
+
+def _canonical(fields: Tuple[Any, ...]) -> bytes:
+    return json.dumps(
+        fields, separators=(",", ":"), ensure_ascii=True, default=str,
+    ).encode("ascii")
 
 
 class AuditLog:
     """
-    In-memory append-only audit log.
-    Every vault operation is stored as a structured dict entry.
+    In-memory audit log with a bounded retention window.
+    Every vault operation is stored as an AuditRow and returned to
+    callers as a structured dict entry. Timestamps are kept as POSIX
+    seconds and only formatted as ISO-8601 strings on read.
+    record() takes a write lock; readers share a read lock. Hot paths can
+    use enqueue() instead, which defers the work to a batched flush;
+    close() (or interpreter exit) flushes whatever is still queued.
+
+    Only the newest max_entries rows are kept in memory. For a durable
+    trail, pass a sink: it is called with every entry dict, in record
+    order and outside the log's lock (e.g. to append to a JSONL file), so
+    rows evicted from memory remain available there.
+
+    With mask_on_export (the default) rows keep the full token and
+    session ID in memory — they never leave the process that created
+    them — and masking is applied where entries cross that boundary:
+    get_entries() and the sink. With mask_on_export=False values are
+    masked once, at record time.
 
     Usage
     -----
@@ -26,8 +170,46 @@ class AuditLog:
     entries = log.get_entries(session_id="sess_abc")
     """
 
-    def __init__(self):
-        self._entries: List[Dict[str, Any]] = []
+    def __init__(
+        self,
+        max_entries: Optional[int] = 100_000,
+        sink: Optional[Callable[[Dict[str, Any]], None]] = None,
+        mask_on_export: bool = True,
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1 or None, got {max_entries!r}")
+
+        self._entries: List[AuditRow] = []
+        self._max     = max_entries
+        self._sink    = sink
+        self._mask_on_export = mask_on_export
+
+        # Rows are numbered by a monotonic sequence; row `seq` lives at
+        # _entries[seq - _offset] and the oldest retained row is _base.
+        # Evicted rows stay in the list until the next sweep compacts it,
+        # so lookups are O(1) list indexing rather than deque walks.
+        self._next_seq = 0
+        self._offset   = 0
+        self._base     = 0
+        self._evicted  = 0   # evictions since the last sweep
+
+        # Inverted indexes: field value → row sequence numbers (ascending)
+        self._by_session: Dict[str, List[int]] = defaultdict(list)
+        self._by_op:      Dict[str, List[int]] = defaultdict(list)
+        self._by_result:  Dict[str, List[int]] = defaultdict(list)
+        # Rows that fired a security alert, by the item's alert level
+        self._by_alert_level: Dict[str, List[int]] = defaultdict(list)
+        self._last_hash = _GENESIS_HASH
+        self._lock = RWLock()
+
+        # enqueue() buffer; deque append/popleft are thread-safe without the lock
+        self._pending: Deque[tuple] = deque()
+        _open_logs.add(self)
+
+        # Rows awaiting the sink, appended under the write lock (so in
+        # sequence order) and handed to the sink after it is released
+        self._outbox: Deque[AuditRow] = deque()
+        self._sink_lock = threading.Lock()
 
     def record(
         self,
@@ -36,8 +218,13 @@ class AuditLog:
         session_id: str = "",
         caller: str = "",
         result: str = "success",
+        *,
+        token_masked:   Optional[str] = None,
+        session_masked: Optional[str] = None,
+        alert_level:    Optional[str] = None,
+        alert_fired:    bool = False,
         **kwargs: Any,
-    ) -> Dict[str, Any]:
+    ) -> AuditRow:
         """
         Append one audit log entry.
 
@@ -48,24 +235,128 @@ class AuditLog:
         session_id : Session that performed the operation.
         caller     : Caller identity (OWNER, RESOLVER, etc.).
         result     : "success" | "denied" | "expired" | "not_found"
+        token_masked, session_masked :
+                     Already-masked forms (e.g. from a VaultEntry). Used
+                     instead of masking token / session_id when the log
+                     masks at record time, or when no raw value is given.
+        alert_level, alert_fired :
+                     Set alert_fired when the operation raised a security
+                     alert; the row then carries both fields and is listed
+                     by get_alert_entries().
         **kwargs   : Extra fields (data_type, family, alert_level, etc.)
 
         Returns
         -------
-        dict
-            The log entry that was recorded.
-        """
-        entry: Dict[str, Any] = {
-            "timestamp":  datetime.utcnow().isoformat() + "Z",
-            "operation":  operation,
-            "token":      _mask_token(token),
-            "session_id": _mask_session(session_id),
-            "caller":     caller,
-            "result":     result,
-        }
-        entry.update(kwargs)
-        self._entries.append(entry)
-        return entry
+        AuditRow
+            The row that was recorded.
+        """
+        if alert_fired:
+            kwargs["alert_level"] = alert_level
+            kwargs["alert_fired"] = True
+        fields = _row_fields(time.time(), operation, token, session_id, caller,
+                             result, token_masked, session_masked, kwargs,
+                             not self._mask_on_export)
+        with self._lock.write():
+            self._drain()     # queued rows go ahead of this one in the chain
+            row = self._append(fields, alert_level or "" if alert_fired else None)
+        self._emit()
+        return row
+
+    def enqueue(
+        self,
+        operation: str,
+        token: str = "",
+        session_id: str = "",
+        caller: str = "",
+        result: str = "success",
+        *,
+        token_masked:   Optional[str] = None,
+        session_masked: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Queue an audit entry for the hot path (same arguments as record()).
+
+        Costs one deque append: masking, hashing, indexing and the sink call
+        happen when the queue is flushed, which is every _FLUSH_BATCH
+        entries and before any read or record(). The timestamp is taken now.
+        """
+        self._pending.append((time.time(), operation, token, session_id, caller,
+                              result, token_masked, session_masked, kwargs))
+        if len(self._pending) >= _FLUSH_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        """Move queued entries into the log under a single write lock."""
+        if not self._pending:
+            return
+        with self._lock.write():
+            self._drain()
+        self._emit()
+
+    def close(self) -> None:
+        """
+        Flush queued entries so they reach the log and the sink. The log
+        stays usable; call this when the owning vault shuts down.
+        """
+        self.flush()
+
+    def _drain(self) -> None:
+        """Append every queued entry. Caller holds the write lock."""
+        pending = self._pending
+        mask_now = not self._mask_on_export
+        while True:
+            try:
+                item = pending.popleft()
+            except IndexError:
+                break
+            self._append(_row_fields(*item, mask_now))
+
+    def _append(self, fields: Tuple[Any, ...], alert_level: Optional[str] = None) -> AuditRow:
+        """
+        Chain, store and index one row. Caller holds the write lock.
+        alert_level is None unless the row fired an alert.
+        """
+        prev = self._last_hash
+        row  = AuditRow(*fields, prev, _chain_hash(prev + _canonical(fields)))
+        self._last_hash = row.hash
+
+        seq = self._next_seq
+        if self._max is not None and seq - self._base == self._max:
+            self._base    += 1
+            self._evicted += 1
+        self._next_seq += 1
+        self._entries.append(row)
+        self._by_session[row.session_id].append(seq)
+        self._by_op[row.operation].append(seq)
+        self._by_result[row.result].append(seq)
+        if alert_level is not None:
+            self._by_alert_level[alert_level].append(seq)
+
+        if self._max is not None and self._evicted >= self._max:
+            self._sweep()
+
+        if self._sink is not None:
+            self._outbox.append(row)
+        return row
+
+    def _emit(self) -> None:
+        """
+        Hand outboxed rows to the sink. Called after the write lock is
+        released, so a slow sink does not block readers; _sink_lock keeps
+        concurrent emitters from reordering rows.
+        """
+        if self._sink is None or not self._outbox:
+            return
+        outbox = self._outbox
+        mask   = self._mask_on_export
+        with self._sink_lock:
+            while True:
+                try:
+                    row = outbox.popleft()
+                except IndexError:
+                    break
+                self._sink(row.to_dict(mask))
 
     def get_entries(
         self,
@@ -74,43 +365,215 @@ class AuditLog:
         result:     Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Return audit log entries, optionally filtered.
+        Return retained audit log entries, optionally filtered.
 
         Parameters
         ----------
-        session_id : Filter by (masked) session ID prefix.
+        session_id : Filter by session ID (by its masked prefix when
+                     mask_on_export is off).
         operation  : Filter by operation type.
         result     : Filter by result ("success", "denied", etc.)
         """
-        entries = self._entries
+        mask = self._mask_on_export
+        return [row.to_dict(mask) for row in self._select(session_id, operation, result)]
+
+    def get_timestamped_entries(
+        self,
+        session_id: Optional[str] = None,
+        operation:  Optional[str] = None,
+        result:     Optional[str] = None,
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Like get_entries(), but as (POSIX timestamp, entry) pairs, so callers
+        that need a datetime need not parse the entry's ISO string back.
+        """
+        mask = self._mask_on_export
+        return [
+            (row.timestamp, row.to_dict(mask))
+            for row in self._select(session_id, operation, result)
+        ]
+
+    def _select(
+        self,
+        session_id: Optional[str],
+        operation:  Optional[str],
+        result:     Optional[str],
+    ) -> List[AuditRow]:
+        """Retained rows matching every given filter, oldest first."""
+        filters = []
         if session_id:
-            masked = _mask_session(session_id)
-            entries = [e for e in entries if e.get("session_id") == masked]
+            filters.append(("session_id", self._session_key(session_id), self._by_session))
         if operation:
-            entries = [e for e in entries if e.get("operation") == operation]
+            filters.append(("operation", operation, self._by_op))
         if result:
-            entries = [e for e in entries if e.get("result") == result]
-        return list(entries)
+            filters.append(("result", result, self._by_result))
+
+        self.flush()
+        with self._lock.read():
+            if not filters:
+                rows = self._entries[self._base - self._offset:]
+            else:
+                # Walk the shortest postings list, check the remaining predicates
+                base     = self._base
+                postings = []
+                for field, value, index in filters:
+                    seqs = index.get(value, ())
+                    postings.append((seqs, bisect_left(seqs, base), field, value))
+                postings.sort(key=lambda p: len(p[0]) - p[1])
+                candidates, lo, _, _ = postings[0]
+                rest = [(field, value) for _, _, field, value in postings[1:]]
+
+                entries = self._entries
+                offset  = self._offset
+                rows = []
+                for i in range(lo, len(candidates)):
+                    row = entries[candidates[i] - offset]
+                    if all(getattr(row, field) == value for field, value in rest):
+                        rows.append(row)
+        return rows
+
+    @property
+    def mask_on_export(self) -> bool:
+        """True if rows are stored raw and masked only when read or exported."""
+        return self._mask_on_export
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number of the next row; pass as get_alert_entries(since=…)."""
+        return self._next_seq
+
+    def get_alert_entries(
+        self,
+        session_id: Optional[str] = None,
+        since:      int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return retained entries that fired a security alert, oldest first,
+        optionally only a session's and only rows from sequence `since` on.
+
+        No flush: alert rows are only written by record(), which drains the
+        queue first, so queued entries never hold an alert.
+        """
+        with self._lock.read():
+            start   = max(self._base, since)
+            offset  = self._offset
+            entries = self._entries
+            seqs    = heapq.merge(*(
+                postings[bisect_left(postings, start):]
+                for postings in self._by_alert_level.values()
+            ))
+            rows = [entries[seq - offset] for seq in seqs]
+        if session_id:
+            key  = self._session_key(session_id)
+            rows = [row for row in rows if row.session_id == key]
+        mask = self._mask_on_export
+        return [row.to_dict(mask) for row in rows]
 
     def count(self, session_id: Optional[str] = None) -> int:
-        """Return total number of audit entries (optionally filtered by session)."""
-        return len(self.get_entries(session_id=session_id))
+        """Return number of retained audit entries (optionally filtered by session)."""
+        self.flush()
+        with self._lock.read():
+            if not session_id:
+                return self._next_seq - self._base
+            seqs = self._by_session.get(self._session_key(session_id), ())
+            return len(seqs) - bisect_left(seqs, self._base)
+
+    def verify_chain(self) -> bool:
+        """
+        Recompute the hash chain over the retained entries.
+
+        Returns True if every row's hash matches its contents and links to
+        the row before it. The oldest retained row's prev_hash is taken as
+        the anchor, since earlier rows may have been evicted. The chain
+        covers stored values, so a sink's copy can be re-verified offline
+        only when mask_on_export is off.
+        """
+        self.flush()
+        with self._lock.read():
+            rows = self._entries[self._base - self._offset:]
+        if not rows:
+            return True
+        prev = rows[0].prev_hash
+        for row in rows:
+            if row.prev_hash != prev or row.hash != _chain_hash(prev + row.canonical()):
+                return False
+            prev = row.hash
+        return True
 
     def clear(self) -> None:
         """Remove all audit entries (TEST USE ONLY)."""
-        self._entries.clear()
+        with self._lock.write():
+            self._pending.clear()
+            self._outbox.clear()
+            self._entries.clear()
+            self._offset  = self._base = self._next_seq
+            self._evicted = 0
+            self._by_session.clear()
+            self._by_op.clear()
+            self._by_result.clear()
+            self._by_alert_level.clear()
+
+    def _session_key(self, session_id: str) -> str:
+        """The session value as stored in rows and the session index."""
+        return session_id if self._mask_on_export else mask_session(session_id)
+
+    def _sweep(self) -> None:
+        """
+        Drop evicted rows from the list and their index postings.
+        Caller holds the write lock.
+        """
+        base = self._base
+        del self._entries[:base - self._offset]
+        self._offset = base
+        for index in (self._by_session, self._by_op, self._by_result, self._by_alert_level):
+            for value in list(index):
+                seqs = index[value]
+                cut  = bisect_left(seqs, base)
+                if cut == len(seqs):
+                    del index[value]
+                elif cut:
+                    del seqs[:cut]
+        self._evicted = 0
 
     def __repr__(self) -> str:
-        return f"AuditLog(entries={len(self._entries)})"
+        return (f"AuditLog(entries={self._next_seq - self._base}, max_entries={self._max}, "
+                f"mask_on_export={self._mask_on_export})")
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _mask_token(token: str) -> str:
+# (second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second.
+# Audit rows arrive in bursts within the same second, so the datetime work
+# is done once per second and only the microseconds are formatted per row.
+_ts_cache: Tuple[int, str] = (-1, "")
+
+
+def _format_ts(ts: float) -> str:
+    """Format POSIX seconds like datetime.utcnow().isoformat() + "Z"."""
+    global _ts_cache
+    frac, whole = math.modf(ts)          # same rounding as datetime.fromtimestamp
+    sec, us = int(whole), round(frac * 1_000_000)
+    if us >= 1_000_000:
+        sec, us = sec + 1, us - 1_000_000
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix    = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{us:06d}Z" if us else prefix + "Z"
+
+
+# C0 control characters (and DEL) are dropped so a caller-supplied token or
+# session string cannot forge line breaks or terminal escapes in a log sink.
+_STRIP_CONTROLS = {c: None for c in (*range(0x20), 0x7F)}
+
+
+def mask_token(token: str) -> str:
     """Mask middle of token for log safety."""
-    return token[:16] + "..." if len(token) > 16 else token
+    token = token[:16] + "..." if len(token) > 16 else token
+    return token.translate(_STRIP_CONTROLS)
 
 
-def _mask_session(session_id: str) -> str:
+def mask_session(session_id: str) -> str:
     """Return first 12 chars + ellipsis."""
-    return session_id[:12] + "..." if len(session_id) > 12 else session_id
+    session_id = session_id[:12] + "..." if len(session_id) > 12 else session_id
+    return session_id.translate(_STRIP_CONTROLS)
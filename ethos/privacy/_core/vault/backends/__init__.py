@@ -1,5 +1,5 @@
 """Vault backends package."""
-from ethos.privacy._core.vault.backends.base_backend    import BaseVaultBackend
+from ethos.privacy._core.vault.backends.base_backend    import BaseVaultBackend, VaultEntry
 from ethos.privacy._core.vault.backends.memory_backend  import MemoryBackend
 
-__all__ = ["BaseVaultBackend", "MemoryBackend"]
+__all__ = ["BaseVaultBackend", "VaultEntry", "MemoryBackend"]
@@ -1,9 +1,55 @@
 """Abstract backend interface."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
+@dataclass(slots=True)
+class VaultEntry:
+    """
+    One encrypted vault record, as handed to and returned by backends.
+
+    Attributes:
+        encrypted_value : Raw cipher tag + nonce + ciphertext (never plaintext).
+        session_id      : Session that owns the entry.
+        data_type       : Type label (AADHAAR, OPENAI_KEY, …).
+        family          : Data family.
+        alert_level     : LOW / MEDIUM / HIGH / CRITICAL.
+        created_at      : POSIX seconds.
+        expires_at      : POSIX seconds, or None for no expiry.
+        revoked         : True once the owning session was revoked.
+        masked_token    : Audit-safe form of the token, computed once at store
+                          when the audit log masks at record time; else "".
+        masked_session  : Audit-safe form of session_id, likewise.
+    """
+    encrypted_value: bytes
+    session_id:      str
+    data_type:       str
+    family:          str
+    alert_level:     str
+    created_at:      float
+    expires_at:      Optional[float] = None
+    revoked:         bool            = False
+    masked_token:    str             = ""
+    masked_session:  str             = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the entry as a plain dict (debugging / serialising backends)."""
+        return {
+            "encrypted_value": self.encrypted_value,
+            "session_id":      self.session_id,
+            "data_type":       self.data_type,
+            "family":          self.family,
+            "alert_level":     self.alert_level,
+            "created_at":      self.created_at,
+            "expires_at":      self.expires_at,
+            "revoked":         self.revoked,
+            "masked_token":    self.masked_token,
+            "masked_session":  self.masked_session,
+        }
+
+
 class BaseVaultBackend(ABC):
     """
     Abstract interface that all vault storage backends must implement.
@@ -19,7 +65,7 @@ class BaseVaultBackend(ABC):
     """
 
     @abstractmethod
-    def store(self, token: str, entry: Dict[str, Any]) -> None:
+    def store(self, token: str, entry: VaultEntry) -> None:
         """
         Store an encrypted vault entry indexed by token.
 
@@ -27,28 +73,30 @@ class BaseVaultBackend(ABC):
         ----------
         token : str
             The token string (vault key).
-        entry : dict
-            Must contain at minimum:
-              encrypted_value : bytes
-              session_id      : str
-              data_type       : str
-              family          : str
-              alert_level     : str
-              created_at      : str  (ISO timestamp)
-              expires_at      : str or None
-              revoked         : bool
+        entry : VaultEntry
+            The encrypted record. Backends that persist to a text or
+            row-based store can use entry.to_dict().
         """
         ...
 
+    def store_batch(self, entries: Dict[str, VaultEntry]) -> None:
+        """
+        Store several entries at once (token → entry).
+        Default implementation calls store() per token; backends with a
+        cheaper bulk path (one lock, one transaction) should override it.
+        """
+        for token, entry in entries.items():
+            self.store(token, entry)
+
     @abstractmethod
-    def retrieve(self, token: str) -> Optional[Dict[str, Any]]:
+    def retrieve(self, token: str) -> Optional[VaultEntry]:
         """
         Retrieve a vault entry by token.
 
         Returns
         -------
-        dict or None
-            The entry dict if found, None if no such token exists.
+        VaultEntry or None
+            The entry if found, None if no such token exists.
         """
         ...
 
@@ -61,6 +109,17 @@ class BaseVaultBackend(ABC):
         """
         ...
 
+    def revoke_session(self, session_id: str) -> int:
+        """
+        Revoke every token of a session. Returns how many were revoked.
+        Default implementation lists the session's tokens and calls revoke()
+        per token; backends that can do it in one pass should override it.
+        """
+        tokens = self.list_tokens_for_session(session_id)
+        for token in tokens:
+            self.revoke(token)
+        return len(tokens)
+
     @abstractmethod
     def purge(self, session_id: str) -> int:
         """
@@ -82,7 +141,7 @@ class BaseVaultBackend(ABC):
     def list_tokens_for_session(self, session_id: str) -> list[str]:
         """
         Return all token strings belonging to a session.
-        Used only by revoke(session_id) in the vault.
+        Used by the default revoke_session().
         NOT exposed to external callers through the public API.
         """
         ...
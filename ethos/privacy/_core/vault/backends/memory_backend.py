@@ -2,25 +2,28 @@
 ethos.privacy._core.vault.backends.memory_backend
 ==================================================
 In-memory vault backend.
-All entries stored in a Python dict. Data is lost on process restart.
+All entries stored in sharded Python dicts. Data is lost on process restart.
 Intended for development, demo, and testing only.
 
-All stored values are AES-256-GCM encrypted.
+All stored values are AES-256-GCM encrypted (ChaCha20-Poly1305 on CPUs
+without AES instructions).
 Encryption key is derived from session_id + framework_secret via PBKDF2.
 Even direct inspection of the dict cannot reveal real values.
 """
 
 from __future__ import annotations
 
-import base64
 import hashlib
 import os
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Sequence, Set
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 
-from ethos.privacy._core.vault.backends.base_backend import BaseVaultBackend
+from ethos.privacy._core.vault.backends.base_backend import BaseVaultBackend, VaultEntry
+from ethos.privacy._core.vault.rwlock import RWLock
 
 
 # Framework-level secret (in production, load from env / HSM)
@@ -30,13 +33,27 @@ _FRAMEWORK_SECRET = os.environ.get(
 )
 
 
+# Derived session keys, most recently used last. PBKDF2 is deliberately slow,
+# and one session typically performs many vault operations.
+_KEY_CACHE_SIZE = 1024
+_key_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_key_cache_lock = threading.Lock()
+
+
 def _derive_key(session_id: str) -> bytes:
     """
     Derive a 32-byte AES-256 encryption key from session_id + framework secret.
     Uses PBKDF2-HMAC-SHA256 with 100 000 iterations.
     Key is deterministic for a given session_id — no key storage needed.
+    Derived keys are kept in a bounded LRU cache until evicted or purged.
     """
-    return hashlib.pbkdf2_hmac(
+    with _key_cache_lock:
+        key = _key_cache.get(session_id)
+        if key is not None:
+            _key_cache.move_to_end(session_id)
+            return key
+
+    key = hashlib.pbkdf2_hmac(
         hash_name   = "sha256",
         password    = _FRAMEWORK_SECRET.encode(),
         salt        = session_id.encode(),
@@ -44,20 +61,136 @@ def _derive_key(session_id: str) -> bytes:
         dklen       = 32,
     )
 
+    with _key_cache_lock:
+        _key_cache[session_id] = key
+        if len(_key_cache) > _KEY_CACHE_SIZE:
+            _key_cache.popitem(last=False)
+    return key
+
+
+def purge_session_key(session_id: str) -> None:
+    """Drop the cached derived key for a session (on revoke / purge)."""
+    with _key_cache_lock:
+        _key_cache.pop(session_id, None)
+
+
+# ── Cipher selection ──────────────────────────────────────────────────────────
+# AES-GCM is fastest with hardware AES; without it ChaCha20-Poly1305 is several
+# times faster in software. Ciphertext carries a 1-byte algorithm tag, so
+# values written with either cipher can be decrypted on any host.
+
+_ALG_AESGCM   = b"\x01"
+_ALG_CHACHA20 = b"\x02"
+
+_AEAD_BY_TAG = {
+    _ALG_AESGCM:   AESGCM,
+    _ALG_CHACHA20: ChaCha20Poly1305,
+}
+
+
+def _has_aes_instructions() -> bool:
+    """Best-effort CPU probe (x86 "aes" / ARMv8 "aes" flag in /proc/cpuinfo)."""
+    try:
+        with open("/proc/cpuinfo", encoding="ascii", errors="ignore") as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    return "aes" in line.split(":", 1)[-1].split()
+    except OSError:
+        pass
+    # No cpuinfo (macOS, Windows): mainstream CPUs there all have AES
+    return True
+
+
+def _select_alg() -> bytes:
+    forced = os.environ.get("ETHOS_VAULT_CIPHER", "").lower()
+    if forced in ("aesgcm", "aes-gcm"):
+        return _ALG_AESGCM
+    if forced in ("chacha20", "chacha20-poly1305"):
+        return _ALG_CHACHA20
+    return _ALG_AESGCM if _has_aes_instructions() else _ALG_CHACHA20
+
+
+_ALG_TAG  = _select_alg()
+_AEAD_CLS = _AEAD_BY_TAG[_ALG_TAG]
+
+
+# ── Nonces ────────────────────────────────────────────────────────────────────
+
+class _NonceSource:
+    """
+    Hands out CSPRNG bytes from a pre-drawn os.urandom() block, so most
+    encryptions make no syscall. One instance per thread (no locking); the
+    child side of fork() drops every source (see _reset_nonces) so parent
+    and child never share nonces.
+    """
+
+    __slots__ = ("_block", "_buf", "_off")
+
+    def __init__(self, block: int = 8192):
+        self._block = block
+        self._buf   = b""
+        self._off   = 0
+
+    def take(self, n: int = 12) -> bytes:
+        if n > self._block:
+            return os.urandom(n)
+        off = self._off
+        if off + n > len(self._buf):
+            self._buf = os.urandom(self._block)
+            off = 0
+        self._off = off + n
+        return self._buf[off:off + n]
+
+
+_nonce_local = threading.local()
+
+
+def _reset_nonces() -> None:
+    global _nonce_local
+    _nonce_local = threading.local()
+
+
+# Without fork() there is nothing to reset (Windows)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_nonces)
+
+
+def _nonces(n: int) -> bytes:
+    src = getattr(_nonce_local, "source", None)
+    if src is None:
+        src = _nonce_local.source = _NonceSource()
+    return src.take(n)
+
 
 def encrypt_value(plaintext: str, session_id: str) -> bytes:
     """
-    Encrypt a plaintext string with AES-256-GCM.
-    Returns: nonce (12 bytes) + ciphertext bytes, base64-encoded.
+    Encrypt a plaintext string with AES-256-GCM (or ChaCha20-Poly1305 on
+    CPUs without AES instructions).
+    Returns: alg tag (1 byte) + nonce (12 bytes) + ciphertext, as raw bytes.
+    Backends that can only hold text should encode at their own boundary.
+    """
+    aead  = _AEAD_CLS(_derive_key(session_id))
+    nonce = _nonces(12)
+    ct    = aead.encrypt(nonce, plaintext.encode("utf-8"), None)
+    return _ALG_TAG + nonce + ct
+
+
+def encrypt_values(plaintexts: Sequence[str], session_id: str) -> List[bytes]:
+    """
+    Batch form of encrypt_value() for values owned by one session:
+    one key lookup, one cipher object, one nonce draw for the whole batch.
     """
-    key    = _derive_key(session_id)
-    aesgcm = AESGCM(key)
-    nonce  = os.urandom(12)
-    ct     = aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
-    return base64.b64encode(nonce + ct)
+    aead   = _AEAD_CLS(_derive_key(session_id))
+    tag    = _ALG_TAG
+    nonces = _nonces(12 * len(plaintexts))
+    out: List[bytes] = []
+    for i, plaintext in enumerate(plaintexts):
+        nonce = nonces[i * 12:(i + 1) * 12]
+        out.append(tag + nonce + aead.encrypt(nonce, plaintext.encode("utf-8"), None))
+    return out
 
 
-def decrypt_value(encrypted_b64: bytes, session_id: str) -> str:
+def decrypt_value(encrypted: bytes, session_id: str) -> str:
     """
     Decrypt a value previously encrypted with encrypt_value().
     Returns the original plaintext string.
@@ -65,64 +198,141 @@ def decrypt_value(encrypted_b64: bytes, session_id: str) -> str:
     Raises
     ------
     ValueError
-        If decryption fails (wrong session key or tampered data).
+        If decryption fails (wrong session key, unknown cipher tag or
+        tampered data).
     """
-    key    = _derive_key(session_id)
-    aesgcm = AESGCM(key)
-    raw    = base64.b64decode(encrypted_b64)
-    nonce, ct = raw[:12], raw[12:]
-    return aesgcm.decrypt(nonce, ct, None).decode("utf-8")
+    aead_cls = _AEAD_BY_TAG.get(encrypted[:1])
+    if aead_cls is None:
+        raise ValueError("Unknown vault cipher tag.")
+    aead = aead_cls(_derive_key(session_id))
+    nonce, ct = encrypted[1:13], encrypted[13:]
+    try:
+        return aead.decrypt(nonce, ct, None).decode("utf-8")
+    except InvalidTag as e:
+        raise ValueError("Vault value failed authentication.") from e
+
+
+class _Shard:
+    """One partition of the store: its own dict, session index and lock."""
+
+    __slots__ = ("store", "by_session", "lock")
+
+    def __init__(self):
+        self.store: Dict[str, VaultEntry] = {}
+        # session_id → tokens, so revoke/purge never scan the whole store
+        self.by_session: Dict[str, Set[str]] = defaultdict(set)
+        self.lock = RWLock()
 
 
 class MemoryBackend(BaseVaultBackend):
     """
-    Dict-based in-memory vault backend with AES-256-GCM encryption.
+    Dict-based in-memory vault backend. Values arrive encrypted with
+    AES-256-GCM, or ChaCha20-Poly1305 on CPUs without AES instructions
+    (ETHOS_VAULT_CIPHER=aesgcm|chacha20 forces one); each value's cipher
+    tag lets it be decrypted whichever cipher is the current default.
 
-    Thread-safety: not thread-safe by default (demo/testing only).
-    For concurrent use, wrap in a threading.Lock.
+    The store is split into shards by hash(token), each guarded by its own
+    readers-writer lock: writes to different shards do not contend, and
+    concurrent retrieves run in parallel. Session-wide operations
+    (revoke_session, purge, list_tokens_for_session) visit the shards one
+    by one, skipping shards that hold nothing for the session.
     """
 
-    def __init__(self):
-        self._store: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, shards: Optional[int] = None):
+        n = shards if shards is not None else 2 * (os.cpu_count() or 1)
+        if n < 1:
+            raise ValueError(f"shards must be >= 1, got {n!r}")
+        self._shards: List[_Shard] = [_Shard() for _ in range(n)]
 
-    def store(self, token: str, entry: Dict[str, Any]) -> None:
+    def _shard(self, token: str) -> _Shard:
+        return self._shards[hash(token) % len(self._shards)]
+
+    def store(self, token: str, entry: VaultEntry) -> None:
         """Store entry. Raises ValueError if token already exists."""
-        if token in self._store:
-            # Idempotent: same token, same session → no-op
-            existing = self._store[token]
-            if existing.get("session_id") == entry.get("session_id"):
-                return
-            raise ValueError(f"Token collision: {token!r} already exists.")
-        self._store[token] = entry
-
-    def retrieve(self, token: str) -> Optional[Dict[str, Any]]:
-        """Return the entry dict for the token, or None if absent."""
-        return self._store.get(token)
+        shard = self._shard(token)
+        with shard.lock.write():
+            existing = shard.store.get(token)
+            if existing is not None:
+                # Idempotent: same token, same session → no-op
+                if existing.session_id == entry.session_id:
+                    return
+                raise ValueError(f"Token collision: {token!r} already exists.")
+            shard.store[token] = entry
+            shard.by_session[entry.session_id].add(token)
+
+    def store_batch(self, entries: Dict[str, VaultEntry]) -> None:
+        """Store several entries, taking each shard's write lock once."""
+        by_shard: Dict[int, List[str]] = defaultdict(list)
+        n = len(self._shards)
+        for token in entries:
+            by_shard[hash(token) % n].append(token)
+
+        for i, tokens in by_shard.items():
+            shard = self._shards[i]
+            with shard.lock.write():
+                for token in tokens:
+                    entry    = entries[token]
+                    existing = shard.store.get(token)
+                    if existing is not None:
+                        if existing.session_id == entry.session_id:
+                            continue
+                        raise ValueError(f"Token collision: {token!r} already exists.")
+                    shard.store[token] = entry
+                    shard.by_session[entry.session_id].add(token)
+
+    def retrieve(self, token: str) -> Optional[VaultEntry]:
+        """Return the entry for the token, or None if absent."""
+        shard = self._shard(token)
+        with shard.lock.read():
+            return shard.store.get(token)
 
     def revoke(self, token: str) -> None:
         """Mark a specific token as revoked."""
-        if token in self._store:
-            self._store[token]["revoked"] = True
+        shard = self._shard(token)
+        with shard.lock.write():
+            entry = shard.store.get(token)
+            if entry is not None:
+                entry.revoked = True
+
+    def revoke_session(self, session_id: str) -> int:
+        """Mark every entry of the session revoked, one write lock per shard."""
+        revoked = 0
+        for shard in self._shards:
+            if session_id not in shard.by_session:
+                continue
+            with shard.lock.write():
+                tokens = shard.by_session.get(session_id, ())
+                store  = shard.store
+                for t in tokens:
+                    store[t].revoked = True
+                revoked += len(tokens)
+        return revoked
 
     def purge(self, session_id: str) -> int:
         """Hard-delete all entries for the session. Returns count deleted."""
-        tokens_to_delete = [
-            t for t, e in self._store.items()
-            if e.get("session_id") == session_id
-        ]
-        for t in tokens_to_delete:
-            del self._store[t]
-        return len(tokens_to_delete)
+        deleted = 0
+        for shard in self._shards:
+            if session_id not in shard.by_session:
+                continue
+            with shard.lock.write():
+                tokens = shard.by_session.pop(session_id, ())
+                for t in tokens:
+                    del shard.store[t]
+                deleted += len(tokens)
+        return deleted
 
     def list_tokens_for_session(self, session_id: str) -> List[str]:
         """Return all token strings belonging to a session."""
-        return [
-            t for t, e in self._store.items()
-            if e.get("session_id") == session_id
-        ]
+        tokens: List[str] = []
+        for shard in self._shards:
+            if session_id not in shard.by_session:
+                continue
+            with shard.lock.read():
+                tokens.extend(shard.by_session.get(session_id, ()))
+        return tokens
 
     def __len__(self) -> int:
-        return len(self._store)
+        return sum(len(shard.store) for shard in self._shards)
 
     def __repr__(self) -> str:
-        return f"MemoryBackend(entries={len(self._store)})"
+        return f"MemoryBackend(entries={len(self)}, shards={len(self._shards)})"
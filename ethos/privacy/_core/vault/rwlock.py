@@ -0,0 +1,76 @@
+"""
+ethos.privacy._core.vault.rwlock
+=================================
+Small readers-writer lock used by the vault backend and audit log.
+
+Any number of readers may hold the lock together; a writer holds it alone.
+Waiting writers block new readers, so a steady stream of retrieves cannot
+starve store / revoke / purge.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class RWLock:
+    """
+    Writer-preferring readers-writer lock (not reentrant).
+
+    Usage
+    -----
+    lock = RWLock()
+    with lock.read():
+        ...
+    with lock.write():
+        ...
+    """
+
+    __slots__ = ("_cond", "_readers", "_writer", "_waiting_writers")
+
+    def __init__(self):
+        self._cond            = threading.Condition(threading.Lock())
+        self._readers         = 0
+        self._writer          = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of the block."""
+        cond = self._cond
+        with cond:
+            while self._writer or self._waiting_writers:
+                cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with cond:
+                self._readers -= 1
+                if not self._readers:
+                    cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock exclusively for the duration of the block."""
+        cond = self._cond
+        with cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with cond:
+                self._writer = False
+                cond.notify_all()
+
+    def __repr__(self) -> str:
+        return (f"RWLock(readers={self._readers}, writer={self._writer}, "
+                f"waiting_writers={self._waiting_writers})")
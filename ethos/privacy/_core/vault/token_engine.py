@@ -14,13 +14,15 @@ Examples:
 
 from __future__ import annotations
 
+import functools
+import re
 import secrets
-import regex
 from typing import Optional
 
 
 # ── Token pattern ─────────────────────────────────────────────────────────────
-TOKEN_RE = regex.compile(
+# Stdlib re is enough here (no `regex` features) and is faster at finditer()
+TOKEN_RE = re.compile(
     r"⟨TKN_([A-Z][A-Z0-9_]*)_([A-F0-9]{8})⟩"
 )
 
@@ -29,6 +31,9 @@ _OPEN  = "⟨"
 _CLOSE = "⟩"
 _PREFIX = "TKN"
 
+# Characters not allowed in the TYPE part of a token
+_UNSAFE_TYPE_CHARS_RE = re.compile(r"[^A-Za-z0-9_]")
+
 
 def generate_token(type_name: str) -> str:
     """
@@ -51,15 +56,19 @@ def generate_token(type_name: str) -> str:
     >>> generate_token("AADHAAR")
     '⟨TKN_AADHAAR_A3F2B7C1⟩'
     """
-    # Sanitise: keep only safe characters, uppercase, max 20 chars
-    safe_type = regex.sub(r"[^A-Za-z0-9_]", "_", type_name).upper()[:20]
-    if not safe_type:
-        safe_type = "UNKNOWN"
-
     # 4 random bytes → 8 uppercase hex characters
     rand_hex = secrets.token_hex(4).upper()
 
-    return f"{_OPEN}{_PREFIX}_{safe_type}_{rand_hex}{_CLOSE}"
+    return f"{_OPEN}{_PREFIX}_{_sanitize_type(type_name)}_{rand_hex}{_CLOSE}"
+
+
+@functools.lru_cache(maxsize=512)
+def _sanitize_type(type_name: str) -> str:
+    """
+    Keep only safe characters, uppercase, max 20 chars.
+    Cached: data_type values come from a small, fixed vocabulary.
+    """
+    return _UNSAFE_TYPE_CHARS_RE.sub("_", type_name).upper()[:20] or "UNKNOWN"
 
 
 def validate_token(token: str) -> bool:
@@ -7,31 +7,37 @@ alert_engine, and the configured backend.
 
 Public operations:
   store(real_value, data_type, family, alert_level, session_id) → token
+  store_many(values, session_id)                                 → [token]
   retrieve(token, session_id, caller)                            → real_value
   revoke(session_id)
   purge(session_id)
   get_audit_entries(session_id)                                  → list
   get_alerts()                                                   → list
+  close()
 
 The vault NEVER exposes get_all() or list_tokens() to external callers.
 """
 
 from __future__ import annotations
 
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from ethos.core.exceptions import VaultAccessError, TokenExpiredError
 from ethos.privacy._core.vault.token_engine import generate_token
 from ethos.privacy._core.vault.access_control import AccessControl, Caller
-from ethos.privacy._core.vault.audit_log import AuditLog
+from ethos.privacy._core.vault.audit_log import AuditLog, mask_session, mask_token
 from ethos.privacy._core.vault.alert_engine import AlertEngine
-from ethos.privacy._core.vault.backends.base_backend import BaseVaultBackend
+from ethos.privacy._core.vault.backends.base_backend import BaseVaultBackend, VaultEntry
 from ethos.privacy._core.vault.backends.memory_backend import (
-    MemoryBackend, encrypt_value, decrypt_value
+    MemoryBackend, encrypt_value, encrypt_values, decrypt_value, purge_session_key
 )
 
+# Module-level bindings for the retrieve() path
+_now          = time.time
+_check_access = AccessControl.check
+
 
 class Vault:
     """
@@ -47,6 +53,9 @@ class Vault:
         Alert engine config (enabled, critical_families, recommend_rotation).
     on_alert : callable or None
         Callback(alert_dict) fired when a CRITICAL item is vaulted.
+    audit_log : AuditLog or None
+        Audit log to record into. Defaults to an AuditLog() with the
+        default retention and no sink.
     """
 
     def __init__(
@@ -55,10 +64,11 @@ class Vault:
         token_expiry_minutes: int = 60,
         alert_config: Optional[Dict[str, Any]] = None,
         on_alert: Optional[Callable] = None,
+        audit_log: Optional[AuditLog] = None,
     ):
         self._backend      = backend or MemoryBackend()
         self._expiry_mins  = token_expiry_minutes
-        self._audit        = AuditLog()
+        self._audit        = audit_log if audit_log is not None else AuditLog()
 
         alert_cfg = alert_config or {}
         self._alerts = AlertEngine(
@@ -68,6 +78,15 @@ class Vault:
             recommend_rotation = alert_cfg.get("recommend_rotation", True),
         )
 
+        # Bound once: retrieve() runs per token on every restore()
+        self._backend_retrieve = self._backend.retrieve
+        self._audit_record     = self._audit.record
+        self._audit_enqueue    = self._audit.enqueue
+
+        # Entries carry pre-masked token / session only for an audit log that
+        # masks at record time; otherwise it masks on export and "" is stored
+        self._premask = not self._audit.mask_on_export
+
     # ── Public API ────────────────────────────────────────────────────────────
 
     def store(
@@ -98,39 +117,129 @@ class Vault:
 
         encrypted = encrypt_value(real_value, session_id)
 
-        now    = datetime.now(timezone.utc)
+        # Timestamps are POSIX seconds so retrieve() can compare with one float op
+        now    = time.time()
         expiry = None
         if self._expiry_mins > 0:
-            from datetime import timedelta
-            expiry = (now + timedelta(minutes=self._expiry_mins)).isoformat()
-
-        entry: Dict[str, Any] = {
-            "encrypted_value": encrypted,
-            "session_id":      session_id,
-            "data_type":       data_type,
-            "family":          family,
-            "alert_level":     alert_level,
-            "created_at":      now.isoformat(),
-            "expires_at":      expiry,
-            "revoked":         False,
-        }
+            expiry = now + self._expiry_mins * 60
+
+        entry = VaultEntry(
+            encrypted_value = encrypted,        # raw bytes: cipher tag + nonce + ciphertext
+            session_id      = session_id,
+            data_type       = data_type,
+            family          = family,
+            alert_level     = alert_level,
+            created_at      = now,
+            expires_at      = expiry,
+            masked_token    = mask_token(token) if self._premask else "",
+            masked_session  = mask_session(session_id) if self._premask else "",
+        )
         self._backend.store(token, entry)
 
-        self._audit.record(
+        # CRITICAL items are flagged on the store record itself, not a second row
+        alert_fired = self._alerts.is_alert(family, alert_level)
+        row = self._audit.record(
             "store",
-            token      = token,
-            session_id = session_id,
-            caller     = Caller.OWNER,
-            result     = "success",
-            data_type  = data_type,
-            family     = family,
+            token          = token,
+            session_id     = session_id,
+            token_masked   = entry.masked_token or None,
+            session_masked = entry.masked_session or None,
+            caller         = Caller.OWNER,
+            result         = "success",
+            alert_level    = alert_level,
+            alert_fired    = alert_fired,
+            data_type      = data_type,
+            family         = family,
         )
-
-        # Fire alert for CRITICAL types
-        self._alerts.check(data_type, family, alert_level, token, session_id)
+        if alert_fired:
+            self._alerts.notify(row, self._audit.mask_on_export)
 
         return token
 
+    def store_many(
+        self,
+        values:     Sequence[Tuple[str, str, str, str]],
+        session_id: str,
+    ) -> List[str]:
+        """
+        Encrypt and store several values for one session. Return their tokens.
+
+        Equivalent to calling store() per value, but encrypts with one key
+        lookup, writes through backend.store_batch(), and records a single
+        "store_batch" audit entry carrying the count.
+
+        Parameters
+        ----------
+        values     : (real_value, data_type, family, alert_level) tuples.
+        session_id : Session that owns the vault entries.
+
+        Returns
+        -------
+        list of str
+            Tokens in the same order as values.
+        """
+        if not values:
+            return []
+
+        encrypted = encrypt_values([v[0] for v in values], session_id)
+
+        now    = time.time()
+        expiry = None
+        if self._expiry_mins > 0:
+            expiry = now + self._expiry_mins * 60
+
+        premask        = self._premask
+        masked_session = mask_session(session_id) if premask else ""
+        tokens:  List[str] = []
+        entries: Dict[str, VaultEntry] = {}
+        for (_, data_type, family, alert_level), enc in zip(values, encrypted):
+            token = generate_token(data_type)
+            while token in entries:          # keep tokens distinct within the batch
+                token = generate_token(data_type)
+            tokens.append(token)
+            entries[token] = VaultEntry(
+                encrypted_value = enc,
+                session_id      = session_id,
+                data_type       = data_type,
+                family          = family,
+                alert_level     = alert_level,
+                created_at      = now,
+                expires_at      = expiry,
+                masked_token    = mask_token(token) if premask else "",
+                masked_session  = masked_session,
+            )
+        self._backend.store_batch(entries)
+
+        self._audit.record(
+            "store_batch",
+            session_id     = session_id,
+            session_masked = masked_session or None,
+            caller         = Caller.OWNER,
+            result         = "success",
+            count          = len(tokens),
+        )
+
+        # One batch row cannot carry per-item alerts, so each alert gets a row
+        for (_, data_type, family, alert_level), token in zip(values, tokens):
+            if self._alerts.is_alert(family, alert_level):
+                entry = entries[token]
+                row = self._audit.record(
+                    "alert",
+                    token          = token,
+                    session_id     = session_id,
+                    token_masked   = entry.masked_token or None,
+                    session_masked = masked_session or None,
+                    caller         = Caller.OWNER,
+                    result         = "success",
+                    alert_level    = alert_level,
+                    alert_fired    = True,
+                    data_type      = data_type,
+                    family         = family,
+                )
+                self._alerts.notify(row, self._audit.mask_on_export)
+
+        return tokens
+
     def retrieve(
         self,
         token:      str,
@@ -158,55 +267,60 @@ class Vault:
         TokenExpiredError
             If the token has passed its expiry time.
         """
-        entry = self._backend.retrieve(token)
+        entry = self._backend_retrieve(token)
+        tok16 = token[:16]
 
         if entry is None:
-            self._audit.record("retrieve", token=token, session_id=session_id,
+            self._audit_record("retrieve", token=token, session_id=session_id,
                                caller=caller, result="not_found")
             raise VaultAccessError(
-                f"Token not found in vault: {token[:16]}...",
-                details={"token": token[:16], "reason": "not_found"},
+                f"Token not found in vault: {tok16}...",
+                details={"token": tok16, "reason": "not_found"},
             )
 
-        token_session = entry["session_id"]
+        token_session = entry.session_id
+        tok_masked    = entry.masked_token or None     # None → audit log masks if needed
 
         # Access control check
         try:
-            AccessControl.check(caller, session_id, token_session, token)
+            _check_access(caller, session_id, token_session, token)
         except VaultAccessError:
-            self._audit.record("retrieve", token=token, session_id=session_id,
-                               caller=caller, result="denied")
+            self._audit_record("retrieve", token=token, session_id=session_id,
+                               token_masked=tok_masked, caller=caller, result="denied")
             raise
 
+        # Past access control the request session is the entry's own session
+        sess_masked = entry.masked_session or None
+
         # Revocation check
-        if entry.get("revoked"):
-            self._audit.record("retrieve", token=token, session_id=session_id,
+        if entry.revoked:
+            self._audit_record("retrieve", token=token, session_id=session_id,
+                               token_masked=tok_masked, session_masked=sess_masked,
                                caller=caller, result="revoked")
             raise VaultAccessError(
-                f"Token has been revoked: {token[:16]}...",
-                details={"token": token[:16], "reason": "revoked"},
+                f"Token has been revoked: {tok16}...",
+                details={"token": tok16, "reason": "revoked"},
             )
 
         # Expiry check
-        expiry = entry.get("expires_at")
-        if expiry:
-            exp_dt = datetime.fromisoformat(expiry)
-            if exp_dt.tzinfo is None:
-                exp_dt = exp_dt.replace(tzinfo=timezone.utc)
-            if datetime.now(timezone.utc) > exp_dt:
-                self._audit.record("retrieve", token=token, session_id=session_id,
-                                   caller=caller, result="expired")
-                raise TokenExpiredError(
-                    f"Token expired: {token[:16]}...",
-                    details={"token": token[:16], "reason": "expired"},
-                )
+        expiry = entry.expires_at
+        if expiry is not None and _now() > expiry:
+            self._audit_record("retrieve", token=token, session_id=session_id,
+                               token_masked=tok_masked, session_masked=sess_masked,
+                               caller=caller, result="expired")
+            raise TokenExpiredError(
+                f"Token expired: {tok16}...",
+                details={"token": tok16, "reason": "expired"},
+            )
 
         # Decrypt and return
-        real_value = decrypt_value(entry["encrypted_value"], token_session)
+        real_value = decrypt_value(entry.encrypted_value, token_session)
 
-        self._audit.record("retrieve", token=token, session_id=session_id,
-                           caller=caller, result="success",
-                           data_type=entry.get("data_type"))
+        # Successful retrieves dominate; queue their audit row (flushed in batches)
+        self._audit_enqueue("retrieve", token=token, session_id=session_id,
+                            token_masked=tok_masked, session_masked=sess_masked,
+                            caller=caller, result="success",
+                            data_type=entry.data_type)
 
         return real_value
 
@@ -221,13 +335,12 @@ class Vault:
         int
             Number of tokens revoked.
         """
-        tokens = self._backend.list_tokens_for_session(session_id)
-        for t in tokens:
-            self._backend.revoke(t)
+        count = self._backend.revoke_session(session_id)
+        purge_session_key(session_id)
         self._audit.record("revoke", session_id=session_id,
                            caller=Caller.OWNER, result="success",
-                           count=len(tokens))
-        return len(tokens)
+                           count=count)
+        return count
 
     def purge(self, session_id: str) -> int:
         """
@@ -240,6 +353,7 @@ class Vault:
             Number of entries hard-deleted.
         """
         count = self._backend.purge(session_id)
+        purge_session_key(session_id)
         self._audit.record("purge", session_id=session_id,
                            caller=Caller.OWNER, result="success",
                            count=count)
@@ -255,9 +369,42 @@ class Vault:
         """Return audit log entries for a session."""
         return self._audit.get_entries(session_id=session_id, operation=operation)
 
-    def get_alerts(self) -> List[Dict[str, Any]]:
-        """Return all security alerts fired in this vault instance."""
-        return self._alerts.get_alerts()
+    def get_timestamped_audit_entries(
+        self,
+        session_id: Optional[str] = None,
+        operation:  Optional[str] = None,
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Return (POSIX timestamp, entry) pairs for a session's audit log."""
+        return self._audit.get_timestamped_entries(session_id=session_id, operation=operation)
+
+    def audit_mark(self) -> int:
+        """Position in the audit log; pass to get_alerts(since=…) later."""
+        return self._audit.next_seq
+
+    def get_alerts(
+        self,
+        session_id: Optional[str] = None,
+        since:      int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return security alerts fired in this vault instance, optionally only
+        a session's and only those recorded after audit_mark() returned since.
+        """
+        alerts = self._alerts
+        return [
+            alerts.from_audit_entry(e)
+            for e in self._audit.get_alert_entries(session_id=session_id, since=since)
+        ]
+
+    # ── Shutdown ──────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """
+        Flush queued audit entries (retrieves are recorded in batches) and
+        release the backend. Call once the vault is no longer used.
+        """
+        self._audit.close()
+        self._backend.close()
 
     def __repr__(self) -> str:
         backend_name = type(self._backend).__name__
@@ -11,12 +11,117 @@ Can be initialized from:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+import copy
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
 
 from ethos.core.config_loader import load_config
 from ethos.privacy.config.validator import ConfigValidator
 
 
+# ── Presets ───────────────────────────────────────────────────────────────────
+# The bundled presets are loaded and validated once, at import; each
+# PrivacyConfig("banking") then costs a deepcopy.
+
+_PRESET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "presets")
+
+_PRESETS: Dict[str, Dict[str, Any]] = {
+    name: ConfigValidator.validate(load_config(name))
+    for name in sorted(
+        f[:-len(".yaml")]
+        for f in (os.listdir(_PRESET_DIR) if os.path.isdir(_PRESET_DIR) else ())
+        if f.endswith(".yaml")
+    )
+}
+
+
+# ── Parsed-config cache ───────────────────────────────────────────────────────
+# Validated raw dicts for YAML file sources, most recently used last, keyed by
+# (abspath, mtime_ns, size) so edits are picked up.
+
+_CFG_CACHE_SIZE = 100
+_CFG_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_CFG_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(source: str) -> Optional[Tuple[Any, ...]]:
+    """Cache key for a YAML path; None if it can't be keyed."""
+    try:
+        st = os.stat(source)
+    except OSError:
+        return None   # let load_config raise its usual ConfigError
+    return (os.path.abspath(source), st.st_mtime_ns, st.st_size)
+
+
+def _load_validated(source: Union[str, Dict[str, Any], None]) -> Dict[str, Any]:
+    """load_config + validate; presets and YAML files are served from memory."""
+    if isinstance(source, str):
+        preset = _PRESETS.get(source)
+        if preset is not None:
+            return copy.deepcopy(preset)
+        key = _cache_key(source)
+    else:
+        key = None
+
+    if key is not None:
+        with _CFG_CACHE_LOCK:
+            cached = _CFG_CACHE.get(key)
+            if cached is not None:
+                _CFG_CACHE.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+    raw = load_config(source) if source is not None else {}
+    raw = ConfigValidator.validate(raw)
+
+    if key is not None:
+        with _CFG_CACHE_LOCK:
+            _CFG_CACHE[key] = copy.deepcopy(raw)
+            if len(_CFG_CACHE) > _CFG_CACHE_SIZE:
+                _CFG_CACHE.popitem(last=False)
+    return raw
+
+
+# ── Typed fields ──────────────────────────────────────────────────────────────
+# attribute → (path in the raw config, default, coercion or None)
+
+_MISSING = object()
+
+_FIELDS: Dict[str, Tuple[Tuple[str, ...], Any, Optional[Any]]] = {
+    # Scanner
+    "families":                (("scanner", "families"),
+                                ["PII", "SECRETS", "FINANCIAL", "INFRA", "BUSINESS"], None),
+    "sensitivity":             (("scanner", "sensitivity"), "medium", None),
+    "safe_fields":             (("scanner", "safe_fields"), [], None),
+    "entropy_enabled":         (("scanner", "entropy", "enabled"), True, None),
+    "entropy_threshold":       (("scanner", "entropy", "threshold"), 3.5, float),
+    "entropy_min_length":      (("scanner", "entropy", "min_length"), 16, int),
+    "entropy_max_length":      (("scanner", "entropy", "max_length"), 512, int),
+    "entropy_require_context": (("scanner", "entropy", "require_context_word"), True, None),
+    "custom_detectors":        (("scanner", "custom_detectors"), [], None),
+    # NLP
+    "nlp_enabled":             (("scanner", "nlp", "enabled"), True, None),
+    "nlp_model":               (("scanner", "nlp", "model"), "en_core_web_sm", None),
+    "nlp_min_confidence":      (("scanner", "nlp", "min_confidence"), 0.60, float),
+    "nlp_context_boost":       (("scanner", "nlp", "context_boost"), 0.15, float),
+    # Vault
+    "backend":                 (("vault", "backend"), "memory", None),
+    "backend_config":          (("vault", "backend_config"), {}, None),
+    "token_expiry_minutes":    (("vault", "token_expiry_minutes"), 60, int),
+    "encryption_enabled":      (("vault", "encryption"), True, None),
+    "alerts_enabled":          (("vault", "alerts", "enabled"), True, None),
+    "critical_families":       (("vault", "alerts", "critical_families"),
+                                ["SECRETS", "FINANCIAL"], None),
+    "on_critical":             (("vault", "alerts", "on_critical"), "log", None),
+    "recommend_rotation":      (("vault", "alerts", "recommend_rotation"), True, None),
+    # Resolver
+    "strict_session":          (("resolver", "strict_session"), True, None),
+    "leave_unresolved":        (("resolver", "leave_unresolved_tokens"), True, None),
+}
+
+
 class PrivacyConfig:
     """
     Typed configuration for PrivacyDataSecurity.
@@ -34,65 +139,62 @@ class PrivacyConfig:
 
     # From YAML file
     cfg = PrivacyConfig("/path/to/my_config.yaml")
+
+    Typed settings (cfg.families, cfg.token_expiry_minutes, …) are read
+    from the raw config on first access and then stored on the instance.
     """
 
-    def __init__(self, source: Union[str, Dict[str, Any], None] = None):
-        raw = load_config(source) if source is not None else {}
-        raw = ConfigValidator.validate(raw)
-        self._raw = raw
-
-        # ── Scanner config ─────────────────────────────────────────────────
-        scanner_cfg = raw.get("scanner", {})
-        self.families: List[str] = scanner_cfg.get(
-            "families", ["PII", "SECRETS", "FINANCIAL", "INFRA", "BUSINESS"]
-        )
-        self.sensitivity: str = scanner_cfg.get("sensitivity", "medium")
-        self.safe_fields: List[str] = scanner_cfg.get("safe_fields", [])
-
-        entropy_cfg = scanner_cfg.get("entropy", {})
-        self.entropy_enabled: bool          = entropy_cfg.get("enabled", True)
-        self.entropy_threshold: float       = float(entropy_cfg.get("threshold", 3.5))
-        self.entropy_min_length: int        = int(entropy_cfg.get("min_length", 16))
-        self.entropy_max_length: int        = int(entropy_cfg.get("max_length", 512))
-        self.entropy_require_context: bool  = entropy_cfg.get("require_context_word", True)
-
-        self.custom_detectors: List[str] = scanner_cfg.get("custom_detectors", [])
-
-        # ── NLP config ─────────────────────────────────────────────────────
-        nlp_cfg = scanner_cfg.get("nlp", {})
-        self.nlp_enabled: bool        = nlp_cfg.get("enabled", True)
-        self.nlp_model: str           = nlp_cfg.get("model", "en_core_web_sm")
-        self.nlp_min_confidence: float = float(nlp_cfg.get("min_confidence", 0.60))
-        self.nlp_context_boost: float  = float(nlp_cfg.get("context_boost", 0.15))
-
-
-        # ── Vault config ───────────────────────────────────────────────────
-        vault_cfg = raw.get("vault", {})
-        self.backend: str                   = vault_cfg.get("backend", "memory")
-        self.backend_config: Dict[str, Any] = vault_cfg.get("backend_config", {})
-        self.token_expiry_minutes: int      = int(vault_cfg.get("token_expiry_minutes", 60))
-        self.encryption_enabled: bool       = vault_cfg.get("encryption", True)
-
-        alerts_cfg = vault_cfg.get("alerts", {})
-        self.alerts_enabled: bool           = alerts_cfg.get("enabled", True)
-        self.critical_families: List[str]   = alerts_cfg.get(
-            "critical_families", ["SECRETS", "FINANCIAL"]
-        )
-        self.on_critical: str              = alerts_cfg.get("on_critical", "log")
-        self.recommend_rotation: bool      = alerts_cfg.get("recommend_rotation", True)
+    # One slot per typed field, plus the raw dict and the two built sub-configs.
+    # An unset slot raises AttributeError, which routes it through __getattr__.
+    __slots__ = ("_raw", "_scanner_cfg", "_vault_cfg", *_FIELDS)
 
-        # ── Resolver config ────────────────────────────────────────────────
-        resolver_cfg = raw.get("resolver", {})
-        self.strict_session: bool       = resolver_cfg.get("strict_session", True)
-        self.leave_unresolved: bool     = resolver_cfg.get("leave_unresolved_tokens", True)
+    def __init__(self, source: Union[str, Dict[str, Any], None] = None):
+        # Typed attributes (families, entropy_threshold, …) are resolved from
+        # _raw on first access — see _FIELDS and __getattr__.
+        self._raw         = _load_validated(source)
+        self._scanner_cfg = None
+        self._vault_cfg   = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, i.e. on first access of a field
+        spec = _FIELDS.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        path, default, coerce = spec
+        try:
+            node: Any = self._raw
+        except AttributeError:      # half-built instance (e.g. during copy)
+            node = {}
+        for key in path[:-1]:
+            node = node.get(key, {})
+        value = node.get(path[-1], _MISSING)
+        if value is _MISSING:
+            value = copy.copy(default) if isinstance(default, (list, dict)) else default
+        if coerce is not None:
+            value = coerce(value)
+        object.__setattr__(self, name, value)   # not a user change: keep cached sub-configs
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _FIELDS:
+            # A setting changed: rebuild scanner_config() / vault_config() next time
+            object.__setattr__(self, "_scanner_cfg", None)
+            object.__setattr__(self, "_vault_cfg", None)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the raw config dict."""
         return dict(self._raw)
 
     def scanner_config(self) -> Dict[str, Any]:
-        """Return scanner sub-config for UniversalScanner."""
-        return {
+        """
+        Return scanner sub-config for UniversalScanner.
+        Built once and shared between calls — treat it as read-only.
+        """
+        cached = self._scanner_cfg
+        if cached is not None:
+            return cached
+        cfg = self._scanner_cfg = {
             "families":    self.families,
             "sensitivity": self.sensitivity,
             "safe_fields": self.safe_fields,
@@ -110,14 +212,22 @@ class PrivacyConfig:
                 "context_boost":  self.nlp_context_boost,
             },
         }
+        return cfg
 
     def vault_config(self) -> Dict[str, Any]:
-        """Return vault alert sub-config for AlertEngine."""
-        return {
+        """
+        Return vault alert sub-config for AlertEngine.
+        Built once and shared between calls — treat it as read-only.
+        """
+        cached = self._vault_cfg
+        if cached is not None:
+            return cached
+        cfg = self._vault_cfg = {
             "enabled":            self.alerts_enabled,
             "critical_families":  self.critical_families,
             "recommend_rotation": self.recommend_rotation,
         }
+        return cfg
 
     def __repr__(self) -> str:
         return (
@@ -7,20 +7,76 @@ when required fields are missing or have unsupported values.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
 
 from ethos.core.exceptions import ConfigError
 
 
-_VALID_FAMILIES     = {"PII", "SECRETS", "FINANCIAL", "INFRA", "BUSINESS"}
-_VALID_SENSITIVITY  = {"low", "medium", "high", "paranoid"}
-_VALID_BACKENDS     = {"memory", "redis", "encrypted_db"}
-_VALID_ON_CRITICAL  = {"log", "notify", "block"}
+_VALID_FAMILIES     = frozenset({"PII", "SECRETS", "FINANCIAL", "INFRA", "BUSINESS"})
+_VALID_SENSITIVITY  = frozenset({"low", "medium", "high", "paranoid"})
+_VALID_BACKENDS     = frozenset({"memory", "redis", "encrypted_db"})
+_VALID_ON_CRITICAL  = frozenset({"log", "notify", "block"})
+
+_MISSING = object()
+
+
+def _positive(v: Any) -> bool:
+    return v > 0
+
+
+def _non_negative(v: Any) -> bool:
+    return v >= 0
+
+
+# ── Schema ────────────────────────────────────────────────────────────────────
+# Checked in order, so a section's own type is checked before its fields.
+# Rows with each=True are list-typed and allowed values apply per element;
+# every other row with allowed values must hold one of them as a scalar.
+
+_Rule = Tuple[
+    Tuple[str, ...],                        # path
+    Any,                                    # required type(s) or None
+    Optional[FrozenSet[Any]],               # allowed values
+    bool,                                   # each: allowed applies per element
+    Optional[Callable[[Any], bool]],        # extra predicate
+    str,                                    # "must be …" text
+]
+
+_SCHEMA: Tuple[_Rule, ...] = (
+    (("scanner",),                          dict,           None,               False, None,          "a dict"),
+    (("scanner", "families"),               list,           _VALID_FAMILIES,    True,  None,          "a list"),
+    (("scanner", "sensitivity"),            None,           _VALID_SENSITIVITY, False, None,          ""),
+    (("scanner", "entropy"),                dict,           None,               False, None,          "a dict"),
+    (("scanner", "entropy", "threshold"),   (int, float),   None,               False, _positive,     "a positive number"),
+    (("vault",),                            dict,           None,               False, None,          "a dict"),
+    (("vault", "backend"),                  None,           _VALID_BACKENDS,    False, None,          ""),
+    (("vault", "token_expiry_minutes"),     int,            None,               False, _non_negative, "a non-negative int"),
+    (("vault", "alerts"),                   dict,           None,               False, None,          "a dict"),
+    (("vault", "alerts", "on_critical"),    None,           _VALID_ON_CRITICAL, False, None,          ""),
+    (("resolver",),                         dict,           None,               False, None,          "a dict"),
+    (("resolver", "strict_session"),        bool,           None,               False, None,          "a bool"),
+)
+
+
+def _is_allowed(value: Any, allowed: FrozenSet[Any]) -> bool:
+    try:
+        return value in allowed
+    except TypeError:       # unhashable (list, dict, …) is never a valid enum
+        return False
+
+
+def _lookup(config: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    node: Any = config
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return _MISSING
+        node = node[key]
+    return node
 
 
 class ConfigValidator:
     """
-    Validates a privacy config dict.
+    Validates a privacy config dict against _SCHEMA.
     All fields are optional (defaults are applied in PrivacyConfig).
     Raises ConfigError for invalid enum values or type mismatches.
     """
@@ -30,82 +86,45 @@ class ConfigValidator:
         """
         Validate the config dict. Returns the same dict if valid.
         Raises ConfigError if any value is invalid.
+
+        Preset and YAML sources are validated once per process: PrivacyConfig
+        caches the validated dict (see privacy_config._load_validated).
         """
         if not isinstance(config, dict):
             raise ConfigError(
                 f"Config must be a dict, got {type(config).__name__}",
                 details={"type": type(config).__name__},
             )
-
-        scanner = config.get("scanner", {})
-        vault   = config.get("vault", {})
-        resolver = config.get("resolver", {})
-
-        # ── Scanner validation ─────────────────────────────────────────────
-        if "families" in scanner:
-            families = scanner["families"]
-            if not isinstance(families, list):
-                raise ConfigError(
-                    "scanner.families must be a list",
-                    details={"got": type(families).__name__},
-                )
-            bad = set(families) - _VALID_FAMILIES
-            if bad:
+        if not config:
+            return config   # PrivacyConfig() / {}: nothing to check
+
+        for path, types, allowed, each, predicate, requirement in _SCHEMA:
+            value = _lookup(config, path)
+            if value is _MISSING:
+                continue
+            name = ".".join(path)
+
+            if (types is not None and not isinstance(value, types)) or (
+                predicate is not None and not predicate(value)
+            ):
                 raise ConfigError(
-                    f"Unknown family/families in scanner.families: {bad}",
-                    details={"valid": sorted(_VALID_FAMILIES)},
+                    f"{name} must be {requirement}, got {value!r}",
+                    details={"got": type(value).__name__},
                 )
 
-        if "sensitivity" in scanner:
-            s = scanner["sensitivity"]
-            if s not in _VALID_SENSITIVITY:
-                raise ConfigError(
-                    f"Invalid scanner.sensitivity: {s!r}",
-                    details={"valid": sorted(_VALID_SENSITIVITY)},
-                )
-
-        if "entropy" in scanner:
-            e = scanner["entropy"]
-            if not isinstance(e, dict):
-                raise ConfigError("scanner.entropy must be a dict")
-            if "threshold" in e:
-                t = e["threshold"]
-                if not isinstance(t, (int, float)) or t <= 0:
+            if allowed is None:
+                continue
+            if each:
+                bad = [v for v in value if not _is_allowed(v, allowed)]
+                if bad:
                     raise ConfigError(
-                        f"scanner.entropy.threshold must be a positive number, got {t!r}"
+                        f"Unknown value(s) in {name}: {bad}",
+                        details={"valid": sorted(allowed)},
                     )
-
-        # ── Vault validation ───────────────────────────────────────────────
-        if "backend" in vault:
-            b = vault["backend"]
-            if b not in _VALID_BACKENDS:
+            elif not _is_allowed(value, allowed):
                 raise ConfigError(
-                    f"Invalid vault.backend: {b!r}",
-                    details={"valid": sorted(_VALID_BACKENDS)},
+                    f"Invalid {name}: {value!r}",
+                    details={"valid": sorted(allowed)},
                 )
 
-        if "token_expiry_minutes" in vault:
-            exp = vault["token_expiry_minutes"]
-            if not isinstance(exp, int) or exp < 0:
-                raise ConfigError(
-                    f"vault.token_expiry_minutes must be a non-negative int, got {exp!r}"
-                )
-
-        if "alerts" in vault:
-            alerts = vault["alerts"]
-            if not isinstance(alerts, dict):
-                raise ConfigError("vault.alerts must be a dict")
-            if "on_critical" in alerts:
-                oc = alerts["on_critical"]
-                if oc not in _VALID_ON_CRITICAL:
-                    raise ConfigError(
-                        f"Invalid vault.alerts.on_critical: {oc!r}",
-                        details={"valid": sorted(_VALID_ON_CRITICAL)},
-                    )
-
-        # ── Resolver validation ────────────────────────────────────────────
-        if "strict_session" in resolver:
-            if not isinstance(resolver["strict_session"], bool):
-                raise ConfigError("resolver.strict_session must be a bool")
-
         return config
@@ -13,9 +13,13 @@ Public API (frozen — never add more public methods):
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union
+import functools
+import secrets
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import regex
 
 from ethos.core.base_module import BaseModule
 from ethos.core.data_types import (
@@ -28,6 +32,11 @@ from ethos.privacy._core.vault.vault import Vault
 from ethos.privacy._core.vault.backends.memory_backend import MemoryBackend
 from ethos.privacy._core.resolver.token_resolver import TokenResolver
 
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
 
 class PrivacyDataSecurity(BaseModule):
     """
@@ -93,35 +102,44 @@ class PrivacyDataSecurity(BaseModule):
 
         self._on_alert = on_alert
 
-        # Lazy-init flag — components built on first use
-        self._scanner:  Optional[UniversalScanner]  = None
-        self._vault:    Optional[Vault]             = None
-        self._resolver: Optional[TokenResolver]     = None
-
     def initialize(self) -> "PrivacyDataSecurity":
-        """Build all internal components. Called automatically on first protect()."""
-        cfg = self._cfg
+        """
+        Build all internal components now. Optional: each component is
+        otherwise built on first use, so audit() / restore() never pay for
+        the scanner.
+        """
+        # Reading each cached property builds it
+        _ = self._scanner
+        _ = self._vault
+        _ = self._resolver
+        self._initialized = True
+        return self
 
-        self._scanner = UniversalScanner(
-            config={"scanner": cfg.scanner_config()}
-        )
+    # ── Components (built lazily, once each) ──────────────────────────────────
+
+    @functools.cached_property
+    def _scanner(self) -> UniversalScanner:
+        return UniversalScanner(config={"scanner": self._cfg.scanner_config()})
 
-        self._vault = Vault(
+    @functools.cached_property
+    def _vault(self) -> Vault:
+        cfg = self._cfg
+        return Vault(
             backend              = MemoryBackend(),
             token_expiry_minutes = cfg.token_expiry_minutes,
             alert_config         = cfg.vault_config(),
             on_alert             = self._on_alert,
         )
 
-        self._resolver = TokenResolver(
+    @functools.cached_property
+    def _resolver(self) -> TokenResolver:
+        cfg = self._cfg
+        return TokenResolver(
             vault             = self._vault,
             strict_session    = cfg.strict_session,
             leave_unresolved  = cfg.leave_unresolved,
         )
 
-        self._initialized = True
-        return self
-
     # ── Public API ────────────────────────────────────────────────────────────
 
     def protect(self, user_input: Union[str, Dict[str, Any]]) -> ProtectResult:
@@ -144,10 +162,7 @@ class PrivacyDataSecurity(BaseModule):
             .alerts         → list of CRITICAL alerts fired
             .scan_results   → full ScanResult list
         """
-        if not self._initialized:
-            self.initialize()
-
-        session_id = f"sess_{uuid.uuid4().hex[:8]}"
+        session_id = "sess_" + secrets.token_hex(4)
 
         # Step 1: Scan
         scan_results: List[ScanResult] = self._scanner.scan(user_input)
@@ -163,40 +178,45 @@ class PrivacyDataSecurity(BaseModule):
             )
 
         # Step 2: Vault each finding and build token map {real_value → token}
-        # Using a dict to avoid vaulting the same value twice
+        # Using a dict to avoid vaulting the same value twice. The audit
+        # summary counts are gathered in the same pass.
         value_to_token: Dict[str, str] = {}
+        families: Dict[str, int] = defaultdict(int)
+        types: set = set()
+        add_type = types.add
+        store    = self._vault.store
+        mark     = self._vault.audit_mark()
 
         for result in scan_results:
+            families[result.family] += 1
+            add_type(result.type)
+
             real = result.value
             if real in value_to_token:
                 continue  # already vaulted
 
-            token = self._vault.store(
+            value_to_token[real] = store(
                 real_value  = real,
                 data_type   = result.type,
                 family      = result.family,
                 alert_level = result.alert_level,
                 session_id  = session_id,
             )
-            value_to_token[real] = token
 
         # Step 3: Replace real values with tokens in content
         safe_content = _substitute(user_input, value_to_token)
 
         # Step 4: Build audit summary
-        families: Dict[str, int] = {}
-        for r in scan_results:
-            families[r.family] = families.get(r.family, 0) + 1
-
         audit_summary = {
             "total":        len(value_to_token),
-            "families":     families,
-            "types":        list({r.type for r in scan_results}),
+            "families":     dict(families),
+            "types":        list(types),
             "session_id":   session_id,
-            "timestamp":    datetime.utcnow().isoformat() + "Z",
+            "timestamp":    _now_iso(),
         }
 
-        alerts = self._vault.get_alerts()
+        # Only this call's alerts: its fresh session, from the mark onwards
+        alerts = self._vault.get_alerts(session_id=session_id, since=mark)
 
         return ProtectResult(
             safe_content  = safe_content,
@@ -232,9 +252,6 @@ class PrivacyDataSecurity(BaseModule):
         VaultAccessError
             If session_id does not match (wrong user, wrong session).
         """
-        if not self._initialized:
-            self.initialize()
-
         return self._resolver.resolve(ai_response, session_id)
 
     def audit(self, session_id: str) -> List[AuditEntry]:
@@ -251,24 +268,21 @@ class PrivacyDataSecurity(BaseModule):
         list[AuditEntry]
             One entry per vault operation in the session.
         """
-        if not self._initialized:
-            self.initialize()
-
-        raw_entries = self._vault.get_audit_entries(session_id=session_id)
+        entries = self._vault.get_timestamped_audit_entries(session_id=session_id)
 
+        # Rows keep POSIX seconds, so the datetime is built from the number
+        # rather than parsed back out of the entry's ISO string.
         return [
             AuditEntry(
                 type        = e.get("data_type", "UNKNOWN"),
                 token       = e.get("token", ""),
-                timestamp   = datetime.fromisoformat(
-                    e.get("timestamp", datetime.utcnow().isoformat()).rstrip("Z")
-                ),
+                timestamp   = datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None),
                 access_log  = [e],
                 family      = e.get("family", ""),
                 alert_level = "",
                 session_id  = session_id,
             )
-            for e in raw_entries
+            for ts, e in entries
         ]
 
     # ── Framework integration ─────────────────────────────────────────────────
@@ -301,16 +315,24 @@ class PrivacyDataSecurity(BaseModule):
 
     def revoke_session(self, session_id: str) -> int:
         """Revoke all tokens for a session (e.g., on user logout)."""
-        if not self._initialized:
-            self.initialize()
         return self._vault.revoke(session_id)
 
     def purge_session(self, session_id: str) -> int:
         """GDPR right-to-erasure — permanently delete all session data."""
-        if not self._initialized:
-            self.initialize()
         return self._vault.purge(session_id)
 
+    def close(self) -> None:
+        """Flush pending audit entries and release the vault backend."""
+        if "_vault" in self.__dict__:    # never built → nothing to flush
+            self._vault.close()
+
+
+# ── Timestamps ────────────────────────────────────────────────────────────────
+
+def _now_iso() -> str:
+    """Current UTC time as "YYYY-MM-DDTHH:MM:SS.ffffffZ"."""
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")[:-6] + "Z"
+
 
 # ── Token substitution helper ─────────────────────────────────────────────────
 
@@ -320,19 +342,98 @@ def _substitute(
 ) -> Union[str, Dict[str, Any]]:
     """
     Replace each real value with its token in content.
-    For text: string replace (longest values first to avoid substring issues).
-    For dict: recurse.
+    For text: one left-to-right pass; where values overlap, the leftmost
+    match wins and, at the same position, the longest value.
+    For dict: every nested string leaf (the replacer is built once for all).
     """
+    if not value_to_token:
+        return content
+    if isinstance(content, str):
+        return _make_replacer(value_to_token)(content)
     if isinstance(content, dict):
-        return {k: _substitute(v, value_to_token) for k, v in content.items()}
+        return _substitute_dict(content, _make_replacer(value_to_token))
+    return content
+
+
+def _substitute_dict(
+    content: Dict[str, Any],
+    replace: Callable[[str], str],
+) -> Dict[str, Any]:
+    # Walk nested dicts with an explicit stack: no recursion limit, and each
+    # copy is linked into its parent before being filled, so key order holds.
+    root: Dict[str, Any] = {}
+    stack = [(root, content)]
+    while stack:
+        out, src = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, str):
+                out[key] = replace(value)
+            elif isinstance(value, dict):
+                out[key] = child = {}
+                stack.append((child, value))
+            else:
+                out[key] = value
+    return root
+
+
+# From this many values on, a pyahocorasick automaton beats the regex alternation
+_AUTOMATON_MIN_VALUES = 8
+
+
+def _make_replacer(value_to_token: Dict[str, str]) -> Callable[[str], str]:
+    """
+    Build a text → text replacer for one protect() call: a pyahocorasick
+    automaton for larger maps when the package is installed, otherwise a
+    compiled regex alternation of the values, longest first. Leaves shorter
+    than the shortest value cannot contain a match and are returned as-is.
+    """
+    shortest = min(map(len, value_to_token))
+    if len(value_to_token) == 1:
+        (real_value, token), = value_to_token.items()
+        replace = lambda text: text.replace(real_value, token)
+    elif _ahocorasick is None or len(value_to_token) < _AUTOMATON_MIN_VALUES:
+        pattern = _alternation(sorted(value_to_token, key=len, reverse=True))
+        lookup = value_to_token.__getitem__
+        replace = lambda text: pattern.sub(lambda m: lookup(m.group()), text)
+    else:
+        replace = _automaton_replacer(value_to_token)
+
+    return lambda text: text if len(text) < shortest else replace(text)
+
+
+def _automaton_replacer(value_to_token: Dict[str, str]) -> Callable[[str], str]:
+    """Leftmost-longest replacer over a pyahocorasick automaton."""
+    automaton = _ahocorasick.Automaton()
+    for real_value, token in value_to_token.items():
+        automaton.add_word(real_value, (len(real_value), token))
+    automaton.make_automaton()
+
+    def replace(text: str) -> str:
+        # Every occurrence as (start, -length, token): leftmost first, then longest
+        found = sorted(
+            (end - n + 1, -n, token) for end, (n, token) in automaton.iter(text)
+        )
+        if not found:
+            return text
 
-    if not isinstance(content, str):
-        return content
+        parts: List[str] = []
+        pos = 0
+        for start, neg_n, token in found:
+            if start < pos:
+                continue          # overlaps a match already taken
+            parts.append(text[pos:start])
+            parts.append(token)
+            pos = start - neg_n
+        parts.append(text[pos:])
+        return "".join(parts)
+
+    return replace
 
-    result = content
-    # Sort by length descending to prevent shorter values replacing substrings
-    for real_value in sorted(value_to_token.keys(), key=len, reverse=True):
-        token = value_to_token[real_value]
-        result = result.replace(real_value, token)
 
-    return result
+def _alternation(values: Sequence[str]) -> regex.Pattern:
+    """
+    Compile values (already longest-first) into one alternation. The pattern
+    embeds the plaintext secrets, so it is never cached — neither here nor in
+    the regex module's own pattern cache — and lives only for one call.
+    """
+    return regex.compile("|".join(map(regex.escape, values)), cache_pattern=False)
@@ -0,0 +1,87 @@
+"""
+Shared pytest fixtures.
+
+.env is loaded here, before any test module reads GEMINI_* settings, and the
+real Gemini client is built once per pytest session. The PrivacyDataSecurity
+fixtures are shared by the end-to-end and Gemini test modules.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+import pytest
+import pytest_asyncio
+
+# ── Load .env if present ──────────────────────────────────────────────────────
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(_ROOT, ".env"))
+except ImportError:
+    pass  # python-dotenv optional; rely on shell env
+
+# ── E2E trace logging ─────────────────────────────────────────────────────────
+# Gemini tests log their traces to "e2e.gemini" at DEBUG; E2E_VERBOSE=1 turns
+# them on (stream them with -s), otherwise they are dropped before formatting.
+_e2e_log = logging.getLogger("e2e.gemini")
+if os.environ.get("E2E_VERBOSE"):
+    _e2e_log.setLevel(logging.DEBUG)
+    _e2e_log.addHandler(logging.StreamHandler())
+else:
+    _e2e_log.setLevel(logging.WARNING)
+
+from ethos.privacy import PrivacyConfig, PrivacyDataSecurity
+
+from gemini_client import (
+    API_KEY, GEMINI_MODEL, SKIP_REASON, SYSTEM_PROMPT_FILE, USE_CACHE,
+    CachedGeminiClient, GeminiClient,
+)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def gemini():
+    """
+    Real Gemini client — shared by every test in the session. Set up and torn
+    down on the session event loop the tests run on (see pytest.ini).
+    """
+    if SKIP_REASON:
+        pytest.skip(SKIP_REASON)
+    client_cls = CachedGeminiClient if USE_CACHE else GeminiClient
+    async with client_cls(api_key=API_KEY, model_name=GEMINI_MODEL) as client:
+        if SYSTEM_PROMPT_FILE:
+            with open(SYSTEM_PROMPT_FILE, encoding="utf-8") as f:
+                client.ensure_cache(f.read())
+        yield client
+
+
+# ── Privacy module ────────────────────────────────────────────────────────────
+# Configs are built once per module; each test still gets its own instance
+# (and therefore its own empty vault).
+
+@pytest.fixture(scope="module")
+def _default_cfg():
+    """Default config, loaded once per module."""
+    return PrivacyConfig("default")
+
+
+@pytest.fixture(scope="module")
+def _banking_cfg():
+    """Banking (high-sensitivity) config, loaded once per module."""
+    return PrivacyConfig("banking")
+
+
+@pytest.fixture
+def pds(_default_cfg):
+    """Fresh PrivacyDataSecurity instance (own vault) with default config."""
+    return PrivacyDataSecurity(config=_default_cfg)
+
+
+@pytest.fixture
+def banking_pds(_banking_cfg):
+    """Fresh PrivacyDataSecurity instance (own vault) with banking config."""
+    return PrivacyDataSecurity(config=_banking_cfg)
@@ -0,0 +1,257 @@
+"""
+Gemini client used by the real-AI E2E tests (see test_e2e_gemini.py).
+
+Kept out of the test module so conftest.py can build one client per pytest
+session. Settings come from the environment (conftest.py loads .env first):
+
+  GEMINI_API_KEY             required; tests are skipped without it
+  GEMINI_MODEL               model name (default gemini-2.5-flash)
+  GEMINI_TEST_CACHE=1        replay replies from tests/.gemini_cache/
+  GEMINI_RPM                 pace request starts to this many per minute
+  GEMINI_MAX_CONCURRENT      max requests in flight (default 10)
+  GEMINI_SYSTEM_PROMPT_FILE  system prompt sent via explicit context caching
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import hashlib
+import inspect
+import os
+import random
+import shelve
+import time
+from typing import AsyncIterator
+
+import pytest
+
+from ethos.privacy._core.vault.token_engine import TOKEN_RE
+
+# ── Gemini SDK ────────────────────────────────────────────────────────────────
+try:
+    import google.generativeai as genai
+    _GENAI_AVAILABLE = True
+except ImportError:
+    _GENAI_AVAILABLE = False
+
+try:
+    from google.api_core import exceptions as _api_exc
+    # Worth retrying: quota (429), overload (503), timeouts, server errors (500)
+    _RETRYABLE = (
+        _api_exc.ResourceExhausted,
+        _api_exc.ServiceUnavailable,
+        _api_exc.DeadlineExceeded,
+        _api_exc.InternalServerError,
+    )
+except ImportError:
+    _RETRYABLE = ()
+
+# ── Settings ──────────────────────────────────────────────────────────────────
+GEMINI_MODEL    = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
+API_KEY         = os.environ.get("GEMINI_API_KEY", "")
+SKIP_REASON     = (
+    "GEMINI_API_KEY not set. Set it via env var or .env file to run these tests."
+    if not API_KEY
+    else (
+        "google-generativeai not installed. Run: pip install google-generativeai"
+        if not _GENAI_AVAILABLE
+        else None
+    )
+)
+
+USE_CACHE       = os.environ.get("GEMINI_TEST_CACHE") == "1"
+_RPM            = int(os.environ.get("GEMINI_RPM", "0"))         # 0 → no pacing
+_MAX_CONCURRENT = int(os.environ.get("GEMINI_MAX_CONCURRENT", "10"))
+_MAX_ATTEMPTS   = 4
+_BACKOFF_START  = 0.5    # seconds; doubles per retry, plus up to 1 s jitter
+_BACKOFF_MAX    = 8.0
+_CACHE_DIR      = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".gemini_cache")
+SYSTEM_PROMPT_FILE = os.environ.get("GEMINI_SYSTEM_PROMPT_FILE", "")
+
+requires_gemini = pytest.mark.skipif(
+    bool(SKIP_REASON),
+    reason=SKIP_REASON or "",
+)
+
+
+# ── Gemini helper ─────────────────────────────────────────────────────────────
+
+class GeminiClient:
+    """
+    Thin wrapper around the Gemini generative model.
+    Initialised once per pytest session (the `gemini` fixture in conftest.py).
+
+    The SDK builds one async client on the first call and keeps its
+    transport (an asyncio gRPC channel) open for every later call, so the
+    handshake is paid once. aclose() closes that channel on the running
+    loop; the client is also an async context manager.
+
+    Requests are throttled up front rather than retried into a 429 storm:
+    at most GEMINI_MAX_CONCURRENT in flight, and when GEMINI_RPM is set,
+    request starts are spaced 60 / GEMINI_RPM seconds apart.
+    """
+
+    def __init__(self, api_key: str, model_name: str):
+        genai.configure(api_key=api_key)
+        self._model = genai.GenerativeModel(model_name=model_name)
+        self._model_name = model_name
+        self._interval   = 60.0 / _RPM if _RPM > 0 else 0.0
+        self._next_start = 0.0
+        # Tests share one session loop (pytest.ini); the semaphore still
+        # follows the running loop so the client works under asyncio.run too
+        self._loop       = None
+        self._semaphore  = None
+        self._context    = None
+        self._system     = ""
+
+    def ensure_cache(self, system_instruction: str, ttl_minutes: int = 5) -> None:
+        """
+        Put system_instruction in Gemini's explicit context cache (once) and
+        send every later prompt against it, so the shared prefix is billed
+        at the cached rate. Gemini rejects content below the model's minimum
+        cacheable size (~2048 tokens), so only call this with a real prefix.
+        """
+        if self._context is not None:
+            return
+        self._system  = system_instruction
+        self._context = genai.caching.CachedContent.create(
+            model              = self._model_name,
+            system_instruction = system_instruction,
+            ttl                = datetime.timedelta(minutes=ttl_minutes),
+        )
+        self._model = genai.GenerativeModel.from_cached_content(
+            cached_content=self._context
+        )
+
+    async def aclose(self) -> None:
+        """
+        Delete the context cache, if any, and close the async transport.
+        Must be awaited on the loop the calls were made on: the channel is
+        bound to it. The SDK shares this client process-wide, so close only
+        once nothing else will call Gemini (the end of the pytest session).
+        """
+        if self._context is not None:
+            self._context.delete()
+            self._context = None
+        client    = getattr(self._model, "_async_client", None)
+        transport = getattr(client, "transport", None)
+        if transport is not None:
+            closing = transport.close()
+            if inspect.isawaitable(closing):
+                await closing
+
+    async def __aenter__(self) -> "GeminiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def chat(self, prompt: str) -> str:
+        """
+        Send a single-turn prompt to Gemini and return the text reply.
+        Retries rate-limit / overload / timeout errors with jittered
+        exponential back-off; anything else fails straight away.
+        """
+        async with self._limiter():
+            for attempt in range(_MAX_ATTEMPTS):
+                await self._pace()
+                try:
+                    response = await self._model.generate_content_async(prompt)
+                    return response.text
+                except _RETRYABLE as exc:
+                    if attempt + 1 < _MAX_ATTEMPTS:
+                        await asyncio.sleep(min(
+                            _BACKOFF_MAX,
+                            _BACKOFF_START * 2 ** attempt + random.uniform(0, 1),
+                        ))
+                        continue
+                    error = exc
+                except Exception as exc:
+                    error = exc
+                raise RuntimeError(
+                    f"Gemini API call failed with model '{self._model_name}': {error}"
+                ) from error
+        return ""  # unreachable
+
+    async def chat_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Yield the reply text chunk by chunk as Gemini generates it, so the
+        caller can print or inspect output before the reply completes.
+        Not retried: a failure mid-stream would replay chunks already seen.
+        """
+        async with self._limiter():
+            await self._pace()
+            response = await self._model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                yield chunk.text
+
+    def _limiter(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop, self._semaphore = loop, asyncio.Semaphore(_MAX_CONCURRENT)
+        return self._semaphore
+
+    async def _pace(self) -> None:
+        """Reserve the next request slot under GEMINI_RPM and wait for it."""
+        if not self._interval:
+            return
+        now   = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class CachedGeminiClient(GeminiClient):
+    """
+    GeminiClient that replays earlier replies from an on-disk shelve.
+
+    Vault tokens are random per run, so each one is swapped for a positional
+    placeholder (⟨#0⟩, ⟨#1⟩, …) before keying and storing; on a hit the
+    placeholders are swapped back for the current run's tokens, so restore()
+    still resolves them.
+    """
+
+    def __init__(self, api_key: str, model_name: str, cache_dir: str = _CACHE_DIR):
+        super().__init__(api_key=api_key, model_name=model_name)
+        os.makedirs(cache_dir, exist_ok=True)
+        self._cache = shelve.open(os.path.join(cache_dir, "replies"))
+
+    async def chat(self, prompt: str) -> str:
+        tokens = list(dict.fromkeys(m.group() for m in TOKEN_RE.finditer(prompt)))
+        key    = self._cache_key(_swap(prompt, tokens, _placeholders(tokens)))
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return _swap(cached, _placeholders(tokens), tokens)
+
+        reply = await super().chat(prompt)
+        self._cache[key] = _swap(reply, tokens, _placeholders(tokens))
+        return reply
+
+    async def chat_stream(self, prompt: str) -> AsyncIterator[str]:
+        # Replies are cached whole, so a hit (or a new reply) is one chunk
+        yield await self.chat(prompt)
+
+    def _cache_key(self, prompt: str) -> str:
+        # Local, non-adversarial cache: a 128-bit BLAKE2b of the NUL-joined
+        # fields is plenty, and cheaper than SHA-256 on CPython
+        return hashlib.blake2b(
+            f"{self._model_name}\0{self._system}\0{prompt}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    async def aclose(self) -> None:
+        self._cache.close()
+        await super().aclose()
+
+
+def _placeholders(tokens):
+    return [f"⟨#{i}⟩" for i in range(len(tokens))]
+
+
+def _swap(text: str, old, new) -> str:
+    for a, b in zip(old, new):
+        text = text.replace(a, b)
+    return text
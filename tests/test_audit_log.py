@@ -0,0 +1,136 @@
+"""
+EthosAI Privacy Module — Audit Log Tests
+=========================================
+Exercises the vault's AuditLog directly: queued entries, retention and
+eviction, the hash chain, and masking on export.
+
+Run with: python -m pytest tests/test_audit_log.py -v
+"""
+
+import pytest
+
+from ethos.privacy._core.vault.audit_log import _FLUSH_BATCH, AuditLog
+
+
+_TOKEN   = "⟨TKN_EMAIL_A1B2C3D4⟩"
+_SESSION = "sess_deadbeef"
+
+
+def _enqueue_retrieves(log: AuditLog, n: int) -> None:
+    for _ in range(n):
+        log.enqueue("retrieve", token=_TOKEN, session_id=_SESSION, caller="RESOLVER")
+
+
+# ── Queued entries ────────────────────────────────────────────────────────────
+
+class TestQueue:
+    def test_close_flushes_queued_entries_to_sink(self):
+        exported = []
+        log = AuditLog(sink=exported.append)
+        _enqueue_retrieves(log, 3)
+        assert exported == []
+        log.close()
+        assert [e["operation"] for e in exported] == ["retrieve"] * 3
+
+    def test_full_batch_flushes_inline(self):
+        exported = []
+        log = AuditLog(sink=exported.append)
+        _enqueue_retrieves(log, _FLUSH_BATCH + 3)
+        assert len(exported) == _FLUSH_BATCH      # flushed by enqueue() itself
+        log.close()
+        assert len(exported) == _FLUSH_BATCH + 3
+        assert log.count() == _FLUSH_BATCH + 3
+
+    def test_record_keeps_queued_entries_first(self):
+        log = AuditLog()
+        _enqueue_retrieves(log, 2)
+        log.record("revoke", session_id=_SESSION, caller="OWNER")
+        assert [e["operation"] for e in log.get_entries()] == ["retrieve", "retrieve", "revoke"]
+        assert log.verify_chain()
+
+
+# ── Retention ─────────────────────────────────────────────────────────────────
+
+class TestRetention:
+    _MAX      = 5
+    _SESSIONS = ["sess_00000000", "sess_00000001", "sess_00000002"]
+
+    def _fill(self, log: AuditLog, n: int):
+        """Record n rows over three sessions, every third one an alert."""
+        recorded = []
+        for i in range(n):
+            session = self._SESSIONS[i % 3]
+            alert   = i % 3 == 0
+            log.record("store", token=f"⟨TKN_EMAIL_{i:08X}⟩", session_id=session,
+                       caller="OWNER", alert_level="CRITICAL", alert_fired=alert,
+                       seq=i)
+            recorded.append((session, alert, i))
+        return recorded
+
+    def test_queries_agree_after_eviction(self):
+        log = AuditLog(max_entries=self._MAX)
+        kept = self._fill(log, 23)[-self._MAX:]    # 18 evicted: several sweeps
+
+        assert log.count() == self._MAX
+        assert [e["seq"] for e in log.get_entries()] == [i for _, _, i in kept]
+        for session in self._SESSIONS:
+            expected = [i for s, _, i in kept if s == session]
+            assert log.count(session) == len(expected)
+            assert [e["seq"] for e in log.get_entries(session_id=session)] == expected
+        assert [e["seq"] for e in log.get_alert_entries()] == [i for _, a, i in kept if a]
+        assert log.verify_chain()
+
+    def test_record_after_clear(self):
+        log = AuditLog(max_entries=self._MAX)
+        self._fill(log, 12)
+        log.clear()
+        assert log.count() == 0
+        assert log.get_entries(session_id="sess_00000000") == []
+        assert log.get_alert_entries() == []
+
+        self._fill(log, 4)
+        assert log.count() == 4
+        assert log.count("sess_00000000") == 2
+        assert [e["seq"] for e in log.get_alert_entries()] == [0, 3]
+        assert log.verify_chain()
+
+
+# ── Hash chain ────────────────────────────────────────────────────────────────
+
+class TestHashChain:
+    def _log(self, n: int = 6, max_entries=None) -> AuditLog:
+        log = AuditLog(max_entries=max_entries)
+        for i in range(n):
+            log.record("store", token=f"⟨TKN_EMAIL_{i:08X}⟩", session_id=_SESSION,
+                       caller="OWNER")
+        return log
+
+    @pytest.mark.parametrize("field, value", [
+        ("result",    "denied"),
+        ("token",     "⟨TKN_EMAIL_FFFFFFFF⟩"),
+        ("hash",      b"\x00" * 32),
+        ("prev_hash", b"\x00" * 32),
+    ])
+    def test_tampered_row_fails(self, field, value):
+        log = self._log()
+        assert log.verify_chain()
+        # Rows are immutable tuples; swap one in the backing list as an attacker would
+        log._entries[3] = log._entries[3]._replace(**{field: value})
+        assert not log.verify_chain()
+
+    def test_removed_row_fails(self):
+        log = self._log()
+        del log._entries[2]
+        assert not log.verify_chain()
+
+    def test_verifies_after_eviction(self):
+        log = self._log(n=20, max_entries=4)
+        assert log.count() == 4
+        assert log.verify_chain()
+
+    def test_verifies_after_clear(self):
+        log = self._log()
+        log.clear()
+        assert log.verify_chain()
+        log.record("purge", session_id=_SESSION, caller="OWNER")
+        assert log.verify_chain()
@@ -0,0 +1,128 @@
+"""
+EthosAI Privacy Module — Vault Tests
+=====================================
+Exercises the Vault and MemoryBackend directly: cipher selection, batch
+storage, and masking of what leaves the vault through its audit log.
+
+Run with: python -m pytest tests/test_vault.py -v
+"""
+
+import pytest
+
+from ethos.core.exceptions import VaultAccessError
+from ethos.privacy._core.vault.audit_log import AuditLog
+from ethos.privacy._core.vault.backends import memory_backend
+from ethos.privacy._core.vault.vault import Vault
+
+
+_SESSION = "sess_0123abcd"
+
+
+def _use_cipher(monkeypatch, name: str) -> bytes:
+    """Select a cipher as ETHOS_VAULT_CIPHER does at import; return its tag."""
+    monkeypatch.setenv("ETHOS_VAULT_CIPHER", name)
+    tag = memory_backend._select_alg()
+    monkeypatch.setattr(memory_backend, "_ALG_TAG", tag)
+    monkeypatch.setattr(memory_backend, "_AEAD_CLS", memory_backend._AEAD_BY_TAG[tag])
+    return tag
+
+
+# ── Cipher selection ──────────────────────────────────────────────────────────
+
+class TestCipher:
+    @pytest.mark.parametrize("name, tag", [
+        ("chacha20", memory_backend._ALG_CHACHA20),
+        ("aesgcm",   memory_backend._ALG_AESGCM),
+    ])
+    def test_forced_cipher_round_trips(self, monkeypatch, name, tag):
+        assert _use_cipher(monkeypatch, name) == tag
+        vault = Vault()
+        token = vault.store("secret@example.com", "EMAIL", "PII", "HIGH", _SESSION)
+        assert vault._backend.retrieve(token).encrypted_value[:1] == tag
+        assert vault.retrieve(token, _SESSION) == "secret@example.com"
+
+    def test_value_outlives_default_cipher_change(self, monkeypatch):
+        _use_cipher(monkeypatch, "chacha20")
+        encrypted = memory_backend.encrypt_value("sk-proj-rotated", _SESSION)
+        assert encrypted[:1] == memory_backend._ALG_CHACHA20
+
+        _use_cipher(monkeypatch, "aesgcm")
+        assert memory_backend.decrypt_value(encrypted, _SESSION) == "sk-proj-rotated"
+        assert memory_backend.encrypt_value("x", _SESSION)[:1] == memory_backend._ALG_AESGCM
+
+    def test_unknown_tag_rejected(self):
+        encrypted = memory_backend.encrypt_value("x", _SESSION)
+        with pytest.raises(ValueError):
+            memory_backend.decrypt_value(b"\x7f" + encrypted[1:], _SESSION)
+
+
+# ── Batch storage ─────────────────────────────────────────────────────────────
+
+class TestStoreMany:
+    _VALUES = [
+        ("alice@example.com",                        "EMAIL",      "PII",     "LOW"),
+        ("sk-proj-abcXYZtestKEY1234567890abcdefghij", "OPENAI_KEY", "SECRETS", "CRITICAL"),
+    ]
+
+    def test_store_many(self):
+        vault  = Vault()
+        tokens = vault.store_many(self._VALUES, _SESSION)
+
+        assert len(tokens) == 2
+        for token, (real, *_) in zip(tokens, self._VALUES):
+            assert vault.retrieve(token, _SESSION) == real
+
+        batch = vault.get_audit_entries(session_id=_SESSION, operation="store_batch")
+        assert len(batch) == 1 and batch[0]["count"] == 2
+        assert len(vault.get_audit_entries(session_id=_SESSION, operation="alert")) == 1
+
+        alerts = vault.get_alerts()
+        assert [a["data_type"] for a in alerts] == ["OPENAI_KEY"]
+        assert alerts[0]["severity"] == "CRITICAL"
+
+    def test_store_many_empty(self):
+        assert Vault().store_many([], _SESSION) == []
+
+
+# ── Masking ───────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("mask_on_export", [True, False], ids=["on_export", "at_record"])
+class TestMasking:
+    _SECRET = "sk-proj-abcXYZtestKEY1234567890abcdefghij"
+    _OTHER  = "sess_9999ffff"
+
+    def _vault(self, mask_on_export):
+        exported = []
+        vault = Vault(audit_log=AuditLog(sink=exported.append,
+                                         mask_on_export=mask_on_export))
+        token = vault.store(self._SECRET, "OPENAI_KEY", "SECRETS", "CRITICAL", _SESSION)
+        vault.store_many([("bob@example.com", "EMAIL", "PII", "HIGH")], _SESSION)
+        vault.store("carol@example.com", "EMAIL", "PII", "HIGH", self._OTHER)
+        vault.retrieve(token, _SESSION)                     # queued retrieve row
+        with pytest.raises(VaultAccessError):
+            vault.retrieve(token, self._OTHER)              # denied retrieve row
+        vault.close()
+        return vault, token, exported
+
+    def test_nothing_raw_leaves_the_log(self, mask_on_export):
+        vault, token, exported = self._vault(mask_on_export)
+        audit = vault._audit
+        for name, entries in [
+            ("sink",              exported),
+            ("get_entries",       audit.get_entries()),
+            ("get_alert_entries", audit.get_alert_entries()),
+            ("get_alerts",        vault.get_alerts()),
+        ]:
+            assert entries, name
+            text = repr(entries)
+            for raw in (token, _SESSION, self._OTHER, self._SECRET):
+                assert raw not in text, f"{raw!r} exposed by {name}"
+
+    def test_session_filter(self, mask_on_export):
+        vault, _, exported = self._vault(mask_on_export)
+        own = vault.get_audit_entries(session_id=_SESSION)
+        # store, store_batch, retrieve; the denied retrieve is the other session's
+        assert [e["operation"] for e in own] == ["store", "store_batch", "retrieve"]
+        assert vault._audit.count(_SESSION) == 3
+        assert len(vault.get_audit_entries(session_id=self._OTHER)) == 2
+        assert len(exported) == 5